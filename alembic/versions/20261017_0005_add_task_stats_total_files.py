@@ -0,0 +1,36 @@
+"""Add task_stats.total_files for incremental stat averages.
+
+Revision ID: 20261017_0005
+Revises: 20260311_0004
+Create Date: 2026-10-17 12:00:00
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20261017_0005"
+down_revision = "20260311_0004"
+branch_labels = None
+depends_on = None
+
+
+def _column_exists(bind: sa.engine.Connection, table: str, column: str) -> bool:
+    return any(col["name"] == column for col in sa.inspect(bind).get_columns(table))
+
+
+def upgrade() -> None:
+    # Every dialect: the model and all stat queries read and write this column.
+    bind = op.get_bind()
+    if not _column_exists(bind, "task_stats", "total_files"):
+        op.add_column(
+            "task_stats",
+            sa.Column("total_files", sa.Integer(), nullable=False, server_default="0"),
+        )
+
+
+def downgrade() -> None:
+    # Downgrade is intentionally a no-op. Removing columns may lose data.
+    return
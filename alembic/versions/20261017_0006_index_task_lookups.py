@@ -0,0 +1,56 @@
+"""Index tasks.status and tasks.task_id for status/lookup filters.
+
+Revision ID: 20261017_0006
+Revises: 20261017_0005
+Create Date: 2026-10-17 12:30:00
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20261017_0006"
+down_revision = "20261017_0005"
+branch_labels = None
+depends_on = None
+
+
+def _index_exists(bind: sa.engine.Connection, table: str, index: str) -> bool:
+    result = bind.execute(
+        sa.text(
+            """
+            SELECT COUNT(*)
+            FROM information_schema.STATISTICS
+            WHERE TABLE_SCHEMA = DATABASE()
+              AND TABLE_NAME = :table
+              AND INDEX_NAME = :index
+            """
+        ),
+        {"table": table, "index": index},
+    )
+    return bool(result.scalar())
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name not in {"mysql", "mariadb"}:
+        return
+
+    # In-place, non-locking builds so a live library keeps working during the upgrade.
+    if not _index_exists(bind, "tasks", "ix_tasks_status"):
+        op.execute("CREATE INDEX ix_tasks_status ON tasks (status) ALGORITHM=INPLACE LOCK=NONE")
+    if not _index_exists(bind, "tasks", "ix_tasks_task_id"):
+        op.execute("CREATE INDEX ix_tasks_task_id ON tasks (task_id) ALGORITHM=INPLACE LOCK=NONE")
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name not in {"mysql", "mariadb"}:
+        return
+
+    if _index_exists(bind, "tasks", "ix_tasks_status"):
+        op.execute("DROP INDEX ix_tasks_status ON tasks")
+    if _index_exists(bind, "tasks", "ix_tasks_task_id"):
+        op.execute("DROP INDEX ix_tasks_task_id ON tasks")
@@ -0,0 +1,60 @@
+"""Make task_stats.task_type unique so stat updates can upsert.
+
+Revision ID: 20261017_0007
+Revises: 20261017_0006
+Create Date: 2026-10-17 13:00:00
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20261017_0007"
+down_revision = "20261017_0006"
+branch_labels = None
+depends_on = None
+
+
+def _task_type_index(bind: sa.engine.Connection) -> dict | None:
+    for index in sa.inspect(bind).get_indexes("task_stats"):
+        if index["name"] == "ix_task_stats_task_type":
+            return index
+    return None
+
+
+def upgrade() -> None:
+    # Every dialect: the stat upsert's ON CONFLICT / ON DUPLICATE KEY needs this index.
+    bind = op.get_bind()
+    index = _task_type_index(bind)
+    if index is not None and index["unique"]:
+        return
+
+    # keep the oldest row per task type; duplicates would block the unique index
+    if bind.dialect.name in {"mysql", "mariadb"}:
+        op.execute(
+            """
+            DELETE newer FROM task_stats newer
+            JOIN task_stats older
+              ON older.task_type = newer.task_type
+             AND older.id < newer.id
+            """
+        )
+    else:
+        op.execute(
+            """
+            DELETE FROM task_stats
+            WHERE id NOT IN (SELECT MIN(id) FROM task_stats GROUP BY task_type)
+            """
+        )
+    if index is not None:
+        op.drop_index("ix_task_stats_task_type", table_name="task_stats")
+    op.create_index("ix_task_stats_task_type", "task_stats", ["task_type"], unique=True)
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if _task_type_index(bind) is not None:
+        op.drop_index("ix_task_stats_task_type", table_name="task_stats")
+    op.create_index("ix_task_stats_task_type", "task_stats", ["task_type"])
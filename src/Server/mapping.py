@@ -397,25 +397,33 @@ def update_model_from_input(model: SQLModel, input_data: Any) -> SQLModel:
     Generic mapper: Updates DB model fields from GraphQL input.
     Only sets attributes that exist in the model and are not None in the input.
     """
-    field_map = _field_map_for_model(model)
+    for field_name, value in values_from_input(type(model), input_data).items():
+        setattr(model, field_name, value)
+    return model
+
+
+def values_from_input(model_cls: type[SQLModel], input_data: Any) -> dict[str, Any]:
+    """Model field values carried by a GraphQL input, as update_model_from_input() would set them."""
+    field_map = _field_map_for_model(model_cls)
+    values: dict[str, Any] = {}
     for field_name, value in input_data.__dict__.items():
         target_name = field_map.get(field_name, field_name)
-        if value is None or not hasattr(model, target_name):
+        if value is None or not hasattr(model_cls, target_name):
             continue
         if target_name == "codec" and isinstance(value, str):
             value = _coerce_codec(value)
-        setattr(model, target_name, value)
-    return model
+        values[target_name] = value
+    return values
 
 
-def _field_map_for_model(model: SQLModel) -> dict[str, str]:
-    if isinstance(model, DBFile):
+def _field_map_for_model(model_cls: type[SQLModel]) -> dict[str, str]:
+    if issubclass(model_cls, DBFile):
         return {
             "path": "file_path",
             "extension": "file_extension",
             "size": "file_size",
         }
-    if isinstance(model, DBGenre):
+    if issubclass(model_cls, DBGenre):
         return {
             "name": "genre",
         }
@@ -2,6 +2,7 @@ from typing import Any
 
 import strawberry
 from strawberry.types import Info
+from sqlalchemy import update
 from sqlmodel import select
 
 from Singletons import DBInstance
@@ -25,6 +26,7 @@ from core.dbmodels import (
 from .playerservice import get_player_service
 from .mapping import (
     update_model_from_input,
+    values_from_input,
     map_dbuser_to_user,
     map_dbplaylist_to_playlist,
     map_dblabel_to_label,
@@ -551,13 +553,17 @@ class Mutation:
     async def update_file(self, info: Info, file_id: int, data: FileInput) -> bool:
         """Update file metadata (path, size, format, etc)."""
         _require_admin(info)
+        values = values_from_input(DBFile, data)
         async for session in DBInstance.get_session():
-            file = await session.get(DBFile, file_id)
-            if file:
-                update_model_from_input(file, data)
-                session.add(file)
-                await session.commit()
-                return True
+            if not values:
+                return await session.get(DBFile, file_id) is not None
+            # one UPDATE keyed on the primary key; the row is never loaded
+            result = await session.exec(update(DBFile).where(DBFile.id == file_id).values(values))  # type: ignore
+            await session.commit()
+            if "file_path" in values:
+                # the old path is not known here, so drop every cached file_exists() hit
+                DBInstance.forget_file()
+            return bool(result.rowcount)
         return False
 
     @strawberry.mutation
@@ -569,6 +575,7 @@ class Mutation:
             if file:
                 await session.delete(file)
                 await session.commit()
+                DBInstance.forget_file(file.file_path)
                 return True
         return False
 
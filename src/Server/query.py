@@ -136,6 +136,17 @@ def _apply_filters(stmt: Any, filters: list[Any]) -> Any:
     return stmt
 
 
+async def _page_total(session: Any, total_stmt: Any, offset: int, limit: int, page_len: int) -> int:
+    """
+    Total row count for a page. A short, non-empty page (or an empty first page) ends the
+    result set, so the total is known without running the COUNT(*).
+    """
+    if page_len < limit and (page_len or not offset):
+        return offset + page_len
+    total = await session.exec(total_stmt)
+    return total.one() if total else 0
+
+
 TModel = TypeVar("TModel")
 TGraph = TypeVar("TGraph")
 
@@ -164,9 +175,8 @@ async def _paginate(
         total_stmt = select(func.count()).select_from(model)
 
         results = await session.exec(stmt)
-        total = await session.exec(total_stmt)
-        total_count = total.one() if total else 0
         items = results.all()
+        total_count = await _page_total(session, total_stmt, offset, limit, len(items))
 
         return Paginated[TGraph](items=[mapper(item) for item in items], total=total_count)
 
@@ -221,40 +231,33 @@ class Query:
             total_stmt = select(func.count()).select_from(DBTaskStatSnapshot).where(DBTaskStatSnapshot.task_type == task_type)
 
             results = await session.exec(stmt)
-            total = await session.exec(total_stmt)
-            total_count = total.one() if total else 0
             snaps = results.all()
+            total_count = await _page_total(session, total_stmt, offset, limit, len(snaps))
             mapped = [TaskStatSnapshot(**snap.dict()) for snap in snaps]
             return Paginated[TaskStatSnapshot](items=mapped, total=total_count)
 
     @strawberry.field
     async def task_stat_trend(self, info: Info, task_type: TaskType) -> Optional[TaskStatTrend]:
         _require_admin(info)
-        snapshots = await DBInstance.get_task_stat_snapshots(task_type)
-        if not snapshots:
+        fields = ("imported", "parsed", "trimmed", "deduped", "total_playtime", "total_filesize")
+        series: dict[str, list[StatPoint]] = {field: [] for field in fields}
+        # stream the rows: only the points are kept, not every snapshot object
+        async for snapshot in DBInstance.iter_task_stat_snapshots(task_type):
+            for field in fields:
+                series[field].append(StatPoint(timestamp=snapshot.snapshot_time, value=getattr(snapshot, field) or 0))
+        if not series["imported"]:
             return None
 
-        def build_series(field: str) -> list[StatPoint]:
-            return [StatPoint(timestamp=s.snapshot_time, value=getattr(s, field) or 0) for s in snapshots]
-
-        return TaskStatTrend(
-            task_type=task_type,
-            imported=build_series("imported"),
-            parsed=build_series("parsed"),
-            trimmed=build_series("trimmed"),
-            deduped=build_series("deduped"),
-            total_playtime=build_series("total_playtime"),
-            total_filesize=build_series("total_filesize"),
-        )
+        return TaskStatTrend(task_type=task_type, **series)
 
     @strawberry.field
     async def task_stat_summary(self, info: Info, task_type: TaskType) -> Optional[TaskStatSummary]:
         _require_admin(info)
-        snapshots = await DBInstance.get_task_stat_snapshots(task_type)
-        if len(snapshots) < 2:  # type: ignore
+        snapshots = await DBInstance.get_latest_task_stat_snapshots(task_type, 2)
+        if len(snapshots) < 2:
             return None
 
-        latest, previous = snapshots[-1], snapshots[-2]  # type: ignore
+        latest, previous = snapshots
 
         def compute_delta(field: str) -> StatDelta:
             current = getattr(latest, field, 0)
@@ -394,12 +397,10 @@ class Query:
         stmt = _apply_filters(select(DBUser), user_filters)
 
         async for session in DBInstance.get_session():
-            total_stmt = _apply_filters(select(func.count()).select_from(DBUser), user_filters)
-            total = await session.exec(total_stmt)
-            total_count = total.one() if total else 0
-
             results = await session.exec(stmt.offset(offset).limit(limit))
             users = results.all()
+            total_stmt = _apply_filters(select(func.count()).select_from(DBUser), user_filters)
+            total_count = await _page_total(session, total_stmt, offset, limit, len(users))
             return Paginated[User](items=[map_dbuser_to_user(u) for u in users], total=total_count)
 
     @strawberry.field
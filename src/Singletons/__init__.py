@@ -15,7 +15,7 @@
 from .env_config import EnvConfig
 from .logger import Logger
 from .database import DB, DBInstance
-from .stack import Stack
+from .stack import Stack, Stat
 
 __all__ = (
     "DB",
@@ -23,4 +23,5 @@ __all__ = (
     "EnvConfig",
     "Logger",
     "Stack",
+    "Stat",
 )
@@ -19,19 +19,30 @@ It uses the SQLModel library to connect to the database and perform operations o
 
 from __future__ import annotations
 
-from typing import Any, AsyncGenerator, Callable, Awaitable, Optional, TYPE_CHECKING, Sequence
+from typing import Any, AsyncGenerator, AsyncIterator, Callable, Awaitable, Iterable, Mapping, Optional, TYPE_CHECKING, Sequence
+from contextlib import asynccontextmanager
+from collections import defaultdict
+from contextvars import ContextVar
+from functools import cache
 from pathlib import Path
+from types import ModuleType
 import datetime as dt
 import asyncio
+import time
 
 from sqlmodel import SQLModel, select, func
-from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import DisconnectionError, OperationalError
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import selectinload
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from sqlmodel.ext.asyncio.session import AsyncSession
-from sqlalchemy import text, delete, update
+from sqlalchemy import bindparam, case, text, delete, exists, insert, update
+from sqlalchemy.dialects import mysql, postgresql, sqlite
 
-from core.exceptions import InvalidValueError
-from Enums import ArtType, Stage, TaskStatus, TaskType
+from core.enums import StageType
+from core.exceptions import DatabaseError, InvalidValueError
+from Enums import ArtType, TaskStatus, TaskType
 from .env_config import env_config
 
 if TYPE_CHECKING:
@@ -40,6 +51,136 @@ if TYPE_CHECKING:
 else:
     DBAsyncSession = AsyncSession
 
+# dialect-specific INSERT constructs that support ON CONFLICT / ON DUPLICATE KEY
+_UPSERT_INSERTS: dict[str, Callable[..., Any]] = {
+    "mysql": mysql.insert,
+    "mariadb": mysql.insert,
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+EXISTS_CACHE_TTL = 60.0
+EXISTS_CACHE_SIZE = 100_000
+
+# Session bound by DB.session_scope(), with the task that opened it; read helpers in that
+# same task reuse it instead of opening their own. Tasks spawned inside the block inherit
+# the context but not the session, since an AsyncSession must not be used concurrently.
+_current_session: ContextVar[Optional[tuple[Optional[asyncio.Task[Any]], AsyncSession]]] = ContextVar(
+    "amm_db_session", default=None
+)
+
+
+@cache
+def _models() -> ModuleType:
+    """
+    The dbmodels module, imported on first use and then held here.
+    A top-level import would be circular (dbmodels -> core.task_base -> Singletons),
+    so per-call paths go through this instead of repeating a local import.
+    """
+    import dbmodels
+
+    return dbmodels
+
+
+@cache
+def _art_dispatch() -> dict[ArtType, tuple[Any, str]]:
+    """Owner model and DBPicture link field per art type; models are imported on first use."""
+    models = _models()
+
+    return {
+        ArtType.ALBUM: (models.DBAlbum, "album"),
+        ArtType.ARTIST: (models.DBPerson, "person"),
+        ArtType.LABEL: (models.DBLabel, "label"),
+    }
+
+
+@cache
+def _statements() -> dict[str, Any]:
+    """
+    Hot-path statements, built once with bind parameters; callers pass values per call.
+    UPDATE parameters carry a b_ prefix since names matching a column are reserved.
+    Models are imported on first use.
+    """
+    models = _models()
+    DBFile, DBFileToConvert, DBPicture, DBTask, DBTaskStat = (
+        models.DBFile,
+        models.DBFileToConvert,
+        models.DBPicture,
+        models.DBTask,
+        models.DBTaskStat,
+    )
+
+    return {
+        # EXISTS over the unique file_path index: no row materialization, stops at the first match
+        "file_exists": select(exists().where(DBFile.file_path == bindparam("file_path"))),
+        "set_file_stage": update(DBFile).where(DBFile.id == bindparam("b_file_id")).values(stage_type=bindparam("b_stage")),  # type: ignore
+        "update_task_status": update(DBTask)
+        .where(DBTask.task_id == bindparam("b_task_id"))  # type: ignore
+        .values(status=bindparam("b_status")),
+        # resume_tasks() rebuilds each batch from these relationships after the session has closed
+        "paused_tasks": select(DBTask)
+        .where(DBTask.status == TaskStatus.PAUSED)
+        .options(
+            selectinload(DBTask.batch_files),  # type: ignore
+            selectinload(DBTask.batch_tracks),  # type: ignore
+            selectinload(DBTask.batch_albums),  # type: ignore
+            selectinload(DBTask.batch_persons),  # type: ignore
+            selectinload(DBTask.batch_labels),  # type: ignore
+            selectinload(DBTask.batch_convert).selectinload(DBFileToConvert.file),  # type: ignore
+        ),
+        "task_stats": select(DBTaskStat).where(DBTaskStat.task_type == bindparam("task_type")),
+        # Core insert on the table: executemany over plain dicts, no ORM objects or table lookup
+        "insert_pictures": insert(DBPicture.__table__),  # type: ignore
+    }
+
+
+def _pool_options(database_url: str) -> dict[str, Any]:
+    """Queue pool sizing for the engine; in-memory SQLite must keep its single static connection."""
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return {}
+    return {
+        "poolclass": AsyncAdaptedQueuePool,
+        "pool_size": env_config.DB_POOL_SIZE,
+        "max_overflow": env_config.DB_MAX_OVERFLOW,
+    }
+
+
+class _StatDeltas:
+    """Counter deltas accumulated for one task type until they are flushed."""
+
+    __slots__ = ("imported", "parsed", "trimmed", "deduped", "files", "duration", "size")
+
+    def __init__(self) -> None:
+        self.imported = self.parsed = self.trimmed = self.deduped = 0
+        self.files = self.duration = self.size = 0
+
+    def add(self, imported: int, parsed: int, trimmed: int, deduped: int, files: int, duration: int, size: int) -> None:
+        self.imported += imported
+        self.parsed += parsed
+        self.trimmed += trimmed
+        self.deduped += deduped
+        self.files += files
+        self.duration += duration
+        self.size += size
+
+
+def _rebuilt_stat_values(total_duration: Optional[int], total_filesize: Optional[int], total_files: Optional[int]) -> dict[str, Any]:
+    """DBTaskStat column values for a full rebuild from DBFile aggregates."""
+    total_duration = total_duration or 0
+    total_filesize = total_filesize or 0
+    total_files = total_files or 0
+    now = dt.datetime.now(dt.timezone.utc)
+    return {
+        "total_files": total_files,
+        "total_playtime": total_duration,
+        "total_filesize": total_filesize,
+        "average_playtime": (total_duration // total_files) if total_files else 0,
+        "average_filesize": (total_filesize // total_files) if total_files else 0,
+        "updated_at": now,
+        "last_run": now,  # this marks last full rebuild
+    }
+
 
 class DB:
     def __init__(self) -> None:
@@ -50,35 +191,52 @@ class DB:
             future=True,
             pool_pre_ping=True,
             pool_recycle=1800,
+            # compiled-SQL cache; the default 500 entries is easily churned by the ad-hoc resolver queries
+            query_cache_size=env_config.DB_QUERY_CACHE_SIZE,
+            **_pool_options(env_config.DATABASE_URL),
         )
-        self.async_session_factory = sessionmaker(
-            bind=self.engine,  # type: ignore
+        self.async_session_factory: async_sessionmaker[AsyncSession] = async_sessionmaker(
+            bind=self.engine,
             class_=AsyncSession,
-            expire_on_commit=False,  # type: ignore
+            expire_on_commit=False,
         )
+        # file_path -> monotonic expiry of a confirmed "exists" answer
+        self._exists_cache: dict[str, float] = {}
+        # update_task_stats coalescing: the open batch and its flush per task type
+        self._pending_stats: dict[TaskType, _StatDeltas] = {}
+        self._stat_flushes: dict[TaskType, asyncio.Future[None]] = {}
+        self._stat_locks: defaultdict[TaskType, asyncio.Lock] = defaultdict(asyncio.Lock)
 
     def __call__(self) -> "DB":
         """Compatibility: allow DBInstance() usage in legacy code."""
         return self
 
-    def _run_sync(self, coro: Awaitable[Any]) -> Any:
-        """Run an async coroutine from sync code (legacy tasks)."""
-        try:
-            loop = asyncio.get_running_loop()
-        except RuntimeError:
-            return asyncio.run(coro)
-        # If we're already in an event loop, schedule and return immediately.
-        return loop.create_task(coro)
-
-    def set_file_stage_sync(self, file_id: int, stage: Stage) -> Any:
-        return self._run_sync(self.set_file_stage(file_id, stage))
-
-    def register_picture_sync(self, mbid: str, art_type: ArtType, save_path: Path) -> Any:
-        return self._run_sync(self.register_picture(mbid, art_type, save_path))
-
     async def get_session(self) -> AsyncGenerator[DBAsyncSession, None]:
         """Async session generator for FastAPI/GraphQL Dependency Injection."""
-        async with self.async_session_factory() as session:  # type: ignore
+        async with self.async_session_factory() as session:
+            yield session
+
+    @asynccontextmanager
+    async def session_scope(self) -> AsyncIterator[DBAsyncSession]:
+        """
+        Open one session for a unit of work (e.g. a request) and share it with
+        fetch_one/fetch_all calls made inside the block.
+        """
+        task = asyncio.current_task()
+        current = _current_session.get()
+        if current is not None and current[0] is task:
+            yield current[1]
+            return
+        async with self.async_session_factory() as session:
+            token = _current_session.set((task, session))
+            try:
+                yield session
+            finally:
+                _current_session.reset(token)
+
+    async def get_db(self) -> AsyncGenerator[DBAsyncSession, None]:
+        """FastAPI dependency: one shared session per request."""
+        async with self.session_scope() as session:
             yield session
 
     async def init_db(self) -> None:
@@ -89,92 +247,169 @@ class DB:
     # DRY Core Methods
 
     async def run_in_session(self, func: Callable[[AsyncSession], Awaitable[Any]]) -> Any:
-        """Execute a coroutine within a managed async session and commit."""
-        async with self.async_session_factory() as session:  # type: ignore
-            result = await func(session)
-            await session.commit()
-            return result
+        """
+        Execute a coroutine within a managed async session and commit.
+        Retried once on a fresh connection only if checking out the connection fails, i.e.
+        before func has run. Once func has started nothing is replayed: a connection lost
+        during or after COMMIT may already have applied non-idempotent work (stat deltas,
+        bulk inserts).
+        """
+        started = False
+
+        async def checked_out(session: AsyncSession) -> Any:
+            nonlocal started
+            await session.connection()
+            started = True
+            return await func(session)
 
-    async def fetch_one(self, statement: Any) -> Optional[Any]:
+        try:
+            return await self._run_in_session_once(checked_out)
+        except (DisconnectionError, OperationalError) as exc:
+            if started or not (isinstance(exc, DisconnectionError) or exc.connection_invalidated):
+                raise
+        return await self._run_in_session_once(func)
+
+    async def _run_in_session_once(self, func: Callable[[AsyncSession], Awaitable[Any]]) -> Any:
+        # begin(): commit on success, roll back on error, then hand the connection back to the pool
+        async with self.async_session_factory.begin() as session:
+            return await func(session)
+
+    async def fetch_one(self, statement: Any, params: Optional[Mapping[str, Any]] = None) -> Optional[Any]:
         """Fetch a single row (or None) for a SQLModel select statement."""
-        async with self.async_session_factory() as session:  # type: ignore
-            result = await session.exec(statement)
+        async with self.session_scope() as session:
+            result = await session.exec(statement, params=params)
             return result.first()
 
-    async def fetch_all(self, statement: Any) -> list[Any]:
+    async def fetch_all(self, statement: Any, params: Optional[Mapping[str, Any]] = None) -> list[Any]:
         """Fetch all rows for a SQLModel select statement."""
-        async with self.async_session_factory() as session:  # type: ignore
-            result = await session.exec(statement)
+        async with self.session_scope() as session:
+            result = await session.exec(statement, params=params)
             return result.all()
 
     async def execute_raw(self, query: str) -> Any:
         """Run raw SQL (text) query string."""
         return await self.run_in_session(lambda session: session.execute(text(query)))
 
-    async def execute_stmt(self, stmt: Any) -> Any:
+    async def execute_stmt(self, stmt: Any, params: Optional[Mapping[str, Any]] = None) -> Any:
         """Execute SQLAlchemy statement (Insert/Update/Delete)."""
-        return await self.run_in_session(lambda session: session.execute(stmt))
+        return await self.run_in_session(lambda session: session.execute(stmt, params))
 
     # App Logic Methods
 
-    async def set_file_stage(self, file_id: int, stage: Stage) -> None:
-        """Set processing Stage for a file."""
-        from dbmodels import DBFile
+    async def set_file_stage(self, file_id: int, stage: StageType) -> bool:
+        """Set processing Stage for a file; returns False when no such file exists."""
+        result = await self.execute_stmt(_statements()["set_file_stage"], {"b_file_id": file_id, "b_stage": stage})
+        return bool(result.rowcount)
 
-        stmt = select(DBFile).where(DBFile.id == file_id)
-        file = await self.fetch_one(stmt)
-        if file:
-            file.stage = stage
-            await self.run_in_session(lambda session: session.merge(file))
+    async def set_file_stages_many(self, file_ids: Sequence[int], stage: StageType) -> int:
+        """Move several files to the same Stage in one UPDATE; returns the number of rows hit."""
+        DBFile = _models().DBFile
 
-    async def update_task_status(self, task_id: str, status: TaskStatus) -> None:
-        """Update status of a task."""
-        from dbmodels import DBTask
+        if not file_ids:
+            return 0
+        result = await self.execute_stmt(
+            update(DBFile).where(DBFile.id.in_(file_ids)).values(stage_type=stage)  # type: ignore
+        )
+        return result.rowcount
 
-        stmt = select(DBTask).where(DBTask.task_id == task_id)
-        task = await self.fetch_one(stmt)
-        if task:
-            task.status = status
-            await self.run_in_session(lambda session: session.merge(task))
+    async def set_file_stages(self, stages: Mapping[int, StageType]) -> None:
+        """Set a different Stage per file id as one executemany UPDATE keyed on the primary key."""
+        DBFile = _models().DBFile
 
-    async def file_exists(self, file_path: str) -> bool:
-        """Check if file exists by file path."""
-        from dbmodels import DBFile
+        if not stages:
+            return
+        rows = [{"id": file_id, "stage_type": stage} for file_id, stage in stages.items()]
+        await self.run_in_session(lambda session: session.exec(update(DBFile), params=rows))
+
+    async def update_task_status(self, task_id: str, status: TaskStatus) -> bool:
+        """Update status of a task; returns False when no such task exists."""
+        result = await self.execute_stmt(_statements()["update_task_status"], {"b_task_id": task_id, "b_status": status})
+        return bool(result.rowcount)
 
-        stmt = select(DBFile).where(DBFile.file_path == file_path)
-        return await self.fetch_one(stmt) is not None
+    async def file_exists(self, file_path: str) -> bool:
+        """
+        Check if file exists by file path.
+        Hits are cached for EXISTS_CACHE_TTL seconds; misses always go to the database,
+        since files are inserted outside this class.
+        """
+        cache = self._exists_cache
+        now = time.monotonic()
+        expiry = cache.get(file_path)
+        if expiry is not None:
+            if expiry > now:
+                return True
+            del cache[file_path]
+
+        if not await self.fetch_one(_statements()["file_exists"], {"file_path": file_path}):
+            return False
+        self.remember_file(file_path, now)
+        return True
+
+    def remember_file(self, file_path: str, now: Optional[float] = None) -> None:
+        """Record a known file path so file_exists() can skip the query."""
+        cache = self._exists_cache
+        if len(cache) >= EXISTS_CACHE_SIZE and file_path not in cache:
+            # dicts keep insertion order: drop the oldest entry
+            del cache[next(iter(cache))]
+        cache[file_path] = (time.monotonic() if now is None else now) + EXISTS_CACHE_TTL
+
+    def forget_file(self, file_path: Optional[str] = None) -> None:
+        """Drop one cached path (or all of them) after files are deleted or moved."""
+        if file_path is None:
+            self._exists_cache.clear()
+        else:
+            self._exists_cache.pop(file_path, None)
 
     async def get_paused_tasks(self) -> list[DBTask]:
         """Retrieve all tasks that are paused."""
-        from dbmodels import DBTask
-
-        stmt = select(DBTask).where(DBTask.status == TaskStatus.PAUSED)
-        return await self.fetch_all(stmt)
+        return await self.fetch_all(_statements()["paused_tasks"])
 
     async def register_picture(self, mbid: str, art_type: ArtType, save_path: Path) -> None:
-        from dbmodels import DBAlbum, DBPerson, DBLabel, DBPicture
-
-        # determine which object needs to be retrieved
-        match art_type:
-            case ArtType.ALBUM:
-                stmt = select(DBAlbum).where(DBAlbum.mbid == mbid)
-            case ArtType.ARTIST:
-                stmt = select(DBPerson).where(DBPerson.mbid == mbid)
-            case _:
-                stmt = select(DBLabel).where(DBLabel.mbid == mbid)
-        obj = await self.fetch_one(stmt)
-        if obj is None:
+        """Register one picture for the album, artist or label with this mbid."""
+        if await self.register_pictures([(mbid, art_type, save_path)]):
             raise InvalidValueError(f"DataBase: Invalid mbid {mbid} for {art_type.value}")
-        match art_type:
-            case ArtType.ALBUM:
-                pic_obj = DBPicture(picture_path=str(save_path), album=obj)  # type: ignore
-            case ArtType.ARTIST:
-                pic_obj = DBPicture(picture_path=str(save_path), person=obj)  # type: ignore
-            case _:
-                pic_obj = DBPicture(picture_path=str(save_path), label=obj)  # type: ignore
-        async for session in self.get_session():
-            session.add(pic_obj)
-            await session.commit()
+
+    async def register_pictures(self, pictures: Iterable[tuple[str, ArtType, Path]]) -> list[str]:
+        """
+        Register many (mbid, art_type, save_path) pictures at once: one IN lookup per art type
+        and a single executemany INSERT. Returns the mbids that matched no owner; those are skipped.
+        Paths that are already registered are left alone, so pictures can be offered again.
+        """
+        DBPicture = _models().DBPicture
+
+        dispatch = _art_dispatch()
+        grouped: dict[tuple[Any, str], dict[str, str]] = defaultdict(dict)
+        for mbid, art_type, save_path in pictures:
+            grouped[dispatch.get(art_type) or dispatch[ArtType.LABEL]][mbid] = str(save_path)
+        if not grouped:
+            return []
+
+        async def work(session: AsyncSession) -> list[str]:
+            rows: list[dict[str, Any]] = []
+            missing: list[str] = []
+            offered = [path for paths in grouped.values() for path in paths.values()]
+            result = await session.exec(select(DBPicture.picture_path).where(DBPicture.picture_path.in_(offered)))
+            known = set(result.all())
+            for (model, link), paths in grouped.items():
+                paths = {mbid: path for mbid, path in paths.items() if path not in known}
+                if not paths:
+                    continue
+                result = await session.exec(select(model.mbid, model.id).where(model.mbid.in_(paths)))
+                owners = dict(result.all())
+                for mbid, path in paths.items():
+                    owner_id = owners.get(mbid)
+                    if owner_id is None:
+                        missing.append(mbid)
+                    else:
+                        # uniform keys keep this a single executemany batch
+                        row = {"picture_path": path, "album_id": None, "person_id": None, "label_id": None}
+                        row[f"{link}_id"] = owner_id
+                        rows.append(row)
+            if rows:
+                await session.exec(_statements()["insert_pictures"], params=rows)
+            return missing
+
+        return await self.run_in_session(work)
 
     async def update_task_stats(
         self,
@@ -183,110 +418,166 @@ class DB:
         parsed: int = 0,
         trimmed: int = 0,
         deduped: int = 0,
+        added_files: int = 0,
+        added_duration: int = 0,
+        added_size: int = 0,
     ) -> None:
-        from dbmodels import DBTaskStat, DBFile
-
-        async for session in self.get_session():
-            result = await session.exec(select(DBTaskStat).where(DBTaskStat.task_type == task_type))
-            stat = result.first()
-            now = dt.datetime.now(dt.timezone.utc)
-
-            if not stat:
-                stat = DBTaskStat(task_type=task_type)
-
-            stat.last_run = now
-            stat.imported += imported
-            stat.parsed += parsed
-            stat.trimmed += trimmed
-            stat.deduped += deduped
-
-            # Recalculate playtime + filesize from DBFile
-            query = select(
-                func.sum(DBFile.duration),
-                func.sum(DBFile.file_size),
-                func.count(DBFile.id),  # type: ignore
-            ).where(DBFile.stage >= Stage.IMPORTED)
-
-            result = await session.exec(query)
-            total_duration, total_filesize, total_files = result.one_or_none() or (0, 0, 0)
-
-            stat.total_playtime = total_duration or 0
-            stat.total_filesize = total_filesize or 0
-
-            stat.average_playtime = (stat.total_playtime // total_files) if total_files else 0
-            stat.average_filesize = (stat.total_filesize // total_files) if total_files else 0
+        """
+        Apply counter deltas to a task type's DBTaskStat entry.
+        Totals are maintained incrementally; rebuild_all_task_stats() recomputes them from DBFile.
+        Concurrent calls for the same task type are folded into a single upsert.
+        """
+        pending = self._pending_stats.get(task_type)
+        if pending is not None:
+            # a flush for this task type is about to run: add to it and wait for the shared result
+            pending.add(imported, parsed, trimmed, deduped, added_files, added_duration, added_size)
+            await asyncio.shield(self._stat_flushes[task_type])
+            return
+
+        pending = self._pending_stats[task_type] = _StatDeltas()
+        pending.add(imported, parsed, trimmed, deduped, added_files, added_duration, added_size)
+        flush = self._stat_flushes[task_type] = asyncio.get_running_loop().create_future()
+        try:
+            await asyncio.sleep(0)  # let callers that are already runnable join this batch
+            # closed from here on: later callers start the next batch while this one is written
+            del self._pending_stats[task_type]
+            async with self._stat_locks[task_type]:
+                await self._upsert_task_stats(task_type, pending)
+        except BaseException as exc:
+            flush.set_exception(exc)
+            flush.exception()  # retrieved here; waiting callers still see it raised
+            raise
+        else:
+            flush.set_result(None)
+        finally:
+            # a caller that arrived during the upsert may already own the next batch
+            if self._pending_stats.get(task_type) is pending:
+                del self._pending_stats[task_type]
+            if self._stat_flushes.get(task_type) is flush:
+                del self._stat_flushes[task_type]
+
+    async def _upsert_task_stats(self, task_type: TaskType, deltas: _StatDeltas) -> None:
+        """Add accumulated deltas to the task type's DBTaskStat row in one statement."""
+        DBTaskStat = _models().DBTaskStat
+
+        dialect = self.engine.dialect.name
+        upsert_insert = _UPSERT_INSERTS.get(dialect)
+        if upsert_insert is None:
+            raise DatabaseError(f"DataBase: no upsert support for dialect {dialect}")
+
+        now = dt.datetime.now(dt.timezone.utc)
+        stmt = upsert_insert(DBTaskStat.__table__).values(  # type: ignore
+            task_type=task_type,
+            last_run=now,
+            updated_at=now,
+            imported=deltas.imported,
+            parsed=deltas.parsed,
+            trimmed=deltas.trimmed,
+            deduped=deltas.deduped,
+            total_files=deltas.files,
+            total_playtime=deltas.duration,
+            total_filesize=deltas.size,
+            average_playtime=(deltas.duration // deltas.files) if deltas.files else 0,
+            average_filesize=(deltas.size // deltas.files) if deltas.files else 0,
+        )
 
-            stat.updated_at = now
-            session.add(stat)
-            await session.commit()
+        # on conflict, add the deltas server-side: one round-trip, no read-modify-write
+        current = DBTaskStat.__table__.c  # type: ignore
+        incoming = stmt.inserted if dialect in ("mysql", "mariadb") else stmt.excluded
+        files = current.total_files + incoming.total_files
+        playtime = current.total_playtime + incoming.total_playtime
+        filesize = current.total_filesize + incoming.total_filesize
+        # averages go first: MySQL evaluates assignments left to right and must see the old totals
+        assignments = [
+            ("average_playtime", case((files > 0, playtime // files), else_=0)),
+            ("average_filesize", case((files > 0, filesize // files), else_=0)),
+            ("total_files", files),
+            ("total_playtime", playtime),
+            ("total_filesize", filesize),
+            ("imported", current.imported + incoming.imported),
+            ("parsed", current.parsed + incoming.parsed),
+            ("trimmed", current.trimmed + incoming.trimmed),
+            ("deduped", current.deduped + incoming.deduped),
+            ("last_run", incoming.last_run),
+            ("updated_at", incoming.updated_at),
+        ]
+        if dialect in ("mysql", "mariadb"):
+            stmt = stmt.on_duplicate_key_update(assignments)
+        else:
+            stmt = stmt.on_conflict_do_update(index_elements=[current.task_type], set_=dict(assignments))
+        await self.execute_stmt(stmt)
 
     async def rebuild_all_task_stats(self) -> None:
         """Recalculate all task statistics from current file data."""
-        task_types = (TaskType.IMPORTER, TaskType.PARSER, TaskType.DEDUPER, TaskType.TRIMMER)
-        for task_type in task_types:
-            await self._rebuild_task_type_stats(task_type)
+        models = _models()
+        DBTaskStat, DBFile, DBTask = models.DBTaskStat, models.DBFile, models.DBTask
 
-    async def _rebuild_task_type_stats(self, task_type: TaskType) -> None:
-        """Recalculate a single task type's DBTaskStat entry."""
-        from dbmodels import DBTaskStat, DBFile, DBTask
-
-        async for session in self.get_session():
-            # Retrieve or create stat record
-            result = await session.exec(select(DBTaskStat).where(DBTaskStat.task_type == task_type))
-            stat = result.first() or DBTaskStat(task_type=task_type)
-
-            now = dt.datetime.now(dt.timezone.utc)
-
-            # Query DBFile for metrics (filtered by stage or task type logic)
-            stmt = select(func.sum(DBFile.duration), func.sum(DBFile.file_size), func.count(DBFile.id)).where(  # type: ignore
-                DBFile.task.has(DBTask.task_type == task_type)  # type: ignore
+        task_types = (TaskType.IMPORTER, TaskType.PARSER, TaskType.DEDUPER, TaskType.TRIMMER)
+        async with self.async_session_factory() as session:
+            # one grouped scan of DBFile instead of one aggregate per task type
+            result = await session.exec(
+                select(DBTask.task_type, func.sum(DBFile.duration), func.sum(DBFile.file_size), func.count(DBFile.id))  # type: ignore
+                .join(DBTask, DBFile.task_id == DBTask.id)  # type: ignore
+                .where(DBTask.task_type.in_(task_types))  # type: ignore
+                .group_by(DBTask.task_type)
             )
-
-            result = await session.exec(stmt)
-            total_duration, total_filesize, total_files = result.one_or_none() or (0, 0, 0)
-
-            stat.total_playtime = total_duration or 0
-            stat.total_filesize = total_filesize or 0
-            stat.average_playtime = (stat.total_playtime // total_files) if total_files else 0
-            stat.average_filesize = (stat.total_filesize // total_files) if total_files else 0
-            stat.updated_at = now
-            stat.last_run = now  # this marks last full rebuild
-
-            session.add(stat)
+            totals = {str(task_type): rest for task_type, *rest in result.all()}
+
+            result = await session.exec(select(DBTaskStat.task_type).where(DBTaskStat.task_type.in_(task_types)))  # type: ignore
+            existing = {str(task_type) for task_type in result.all()}
+
+            updates: list[dict[str, Any]] = []
+            inserts: list[dict[str, Any]] = []
+            for task_type in task_types:
+                values = _rebuilt_stat_values(*totals.get(str(task_type), (0, 0, 0)))
+                if str(task_type) in existing:
+                    updates.append({"b_task_type": task_type, **values})
+                else:
+                    inserts.append({"task_type": task_type, **values})
+
+            # Core executemany on the table: SET columns come from the parameter keys
+            table = DBTaskStat.__table__  # type: ignore
+            if updates:
+                await session.exec(update(table).where(table.c.task_type == bindparam("b_task_type")), params=updates)  # type: ignore
+            if inserts:
+                await session.exec(insert(table), params=inserts)  # type: ignore
             await session.commit()
 
     async def get_task_stats(self, task_type: TaskType) -> Optional[DBTaskStat]:
-        from dbmodels import DBTaskStat
-
-        async for session in self.get_session():
-            result = await session.exec(select(DBTaskStat).where(DBTaskStat.task_type == task_type))
+        async with self.async_session_factory() as session:
+            result = await session.exec(_statements()["task_stats"], params={"task_type": task_type})
             return result.first()
 
     async def snapshot_task_stats(self) -> None:
         """Store a snapshot of current task stats (e.g. daily)."""
-        from dbmodels import DBTaskStatSnapshot
-
-        async for session in self.get_session():
-            for task_type in TaskType:
-                stat = await self.get_task_stats(task_type)
-                if stat:
-                    snap = DBTaskStatSnapshot(
-                        task_type=task_type,
-                        snapshot_time=dt.datetime.now(dt.timezone.utc),
-                        total_playtime=stat.total_playtime,
-                        total_filesize=stat.total_filesize,
-                        imported=stat.imported,
-                        parsed=stat.parsed,
-                        trimmed=stat.trimmed,
-                        deduped=stat.deduped,
-                    )
-                    session.add(snap)
-            await session.commit()
+        models = _models()
+        DBTaskStat, DBTaskStatSnapshot = models.DBTaskStat, models.DBTaskStatSnapshot
+
+        async with self.async_session_factory() as session:
+            result = await session.exec(select(DBTaskStat))
+            now = dt.datetime.now(dt.timezone.utc)
+            rows = [
+                {
+                    "task_type": stat.task_type,
+                    "snapshot_time": now,
+                    "total_playtime": stat.total_playtime,
+                    "total_filesize": stat.total_filesize,
+                    "imported": stat.imported,
+                    "parsed": stat.parsed,
+                    "trimmed": stat.trimmed,
+                    "deduped": stat.deduped,
+                }
+                for stat in result.all()
+            ]
+            if rows:
+                # one executemany INSERT instead of a SELECT + add per task type
+                await session.exec(insert(DBTaskStatSnapshot), params=rows)
+                await session.commit()
 
     async def get_task_stat_snapshots(self, task_type: TaskType) -> Optional[list[DBTaskStatSnapshot]]:
-        from dbmodels import DBTaskStatSnapshot
+        DBTaskStatSnapshot = _models().DBTaskStatSnapshot
 
-        async for session in self.get_session():
+        async with self.async_session_factory() as session:
             result = await session.exec(
                 select(DBTaskStatSnapshot)
                 .where(DBTaskStatSnapshot.task_type == task_type)
@@ -296,6 +587,34 @@ class DB:
             )
             return result.all() if result else None  # type: ignore
 
+    async def iter_task_stat_snapshots(
+        self, task_type: TaskType, batch_size: int = 500
+    ) -> AsyncIterator[DBTaskStatSnapshot]:
+        """Stream a task type's snapshots oldest first, batch_size rows per fetch, without loading them all."""
+        DBTaskStatSnapshot = _models().DBTaskStatSnapshot
+
+        stmt = (
+            select(DBTaskStatSnapshot)
+            .where(DBTaskStatSnapshot.task_type == task_type)
+            .order_by(DBTaskStatSnapshot.snapshot_time)  # type: ignore
+            .execution_options(yield_per=batch_size)
+        )
+        async with self.async_session_factory() as session:
+            async for snapshot in await session.stream_scalars(stmt):
+                yield snapshot
+
+    async def get_latest_task_stat_snapshots(self, task_type: TaskType, count: int = 2) -> list[DBTaskStatSnapshot]:
+        """The newest `count` snapshots of a task type, newest first."""
+        DBTaskStatSnapshot = _models().DBTaskStatSnapshot
+
+        stmt = (
+            select(DBTaskStatSnapshot)
+            .where(DBTaskStatSnapshot.task_type == task_type)
+            .order_by(DBTaskStatSnapshot.snapshot_time.desc())  # type: ignore
+            .limit(count)
+        )
+        return await self.fetch_all(stmt)
+
     async def prune_old_tasks(
         self,
         *,
@@ -306,20 +625,21 @@ class DB:
         if older_than_days <= 0:
             return 0
 
-        from dbmodels import (
-            DBTask,
-            DBFile,
-            DBTrack,
-            DBAlbum,
-            DBPerson,
-            DBLabel,
-            DBFileToConvert,
+        models = _models()
+        DBTask, DBFile, DBTrack, DBAlbum, DBPerson, DBLabel, DBFileToConvert = (
+            models.DBTask,
+            models.DBFile,
+            models.DBTrack,
+            models.DBAlbum,
+            models.DBPerson,
+            models.DBLabel,
+            models.DBFileToConvert,
         )
 
         cleanup_statuses = tuple(statuses or (TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED))
         cutoff = dt.datetime.now(dt.timezone.utc) - dt.timedelta(days=older_than_days)
 
-        async for session in self.get_session():
+        async with self.async_session_factory() as session:
             result = await session.exec(
                 select(DBTask.id).where(
                     DBTask.start_time < cutoff,
@@ -346,8 +666,6 @@ class DB:
             await session.commit()
             return len(task_ids)
 
-        return 0
-
 
 # Instantiate globally
 DBInstance = DB()
@@ -42,10 +42,27 @@ def _as_csv(value: Optional[str], default: tuple[str, ...]) -> tuple[str, ...]:
     return items or default
 
 
+# blocking MySQL drivers create_async_engine cannot drive; asyncmy is the async (Cython) one
+_SYNC_MYSQL_DRIVERS = {"", "pymysql", "mysqldb", "mysqlconnector"}
+
+
+def _as_database_url(value: Optional[str], default: str) -> str:
+    """Point MySQL/MariaDB URLs that name a blocking driver (or none) at asyncmy."""
+    url = (value or "").strip() or default
+    scheme, sep, rest = url.partition("://")
+    backend, _, driver = scheme.partition("+")
+    if sep and backend in ("mysql", "mariadb") and driver in _SYNC_MYSQL_DRIVERS:
+        return f"{backend}+asyncmy://{rest}"
+    return url
+
+
 @dataclass(frozen=True)
 class EnvConfig:
-    DATABASE_URL: str = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///amm.db")
+    DATABASE_URL: str = _as_database_url(os.getenv("DATABASE_URL"), "sqlite+aiosqlite:///amm.db")
     DEBUG: bool = _as_bool(os.getenv("DEBUG", "false"), False)
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_QUERY_CACHE_SIZE: int = int(os.getenv("DB_QUERY_CACHE_SIZE", "1200"))
     JWT_SECRET_KEY: str = os.getenv("JWT_SECRET_KEY", "").strip()
     ALLOW_INSECURE_DEFAULT_JWT_SECRET: bool = _as_bool(
         os.getenv("ALLOW_INSECURE_DEFAULT_JWT_SECRET", "false"),
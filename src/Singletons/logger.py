@@ -14,6 +14,7 @@
 #   along with AMM.  If not, see <https://www.gnu.org/licenses/>.
 
 import logging
+from typing import Any
 from logging import getLogger, FileHandler, Formatter, StreamHandler, Logger as PyLogger
 
 from config import Config
@@ -23,6 +24,7 @@ class Logger:
     """
     This class is used to log messages to a file.
     It uses the logging library to log messages to a file.
+    Extra arguments are %-formatted into the message only when the record is emitted.
     """
 
     def __init__(self, config: Config | None = None) -> None:
@@ -39,39 +41,46 @@ class Logger:
         self.logger = self._setup_logger()
 
         self.logger.info("Logger initialized")
-        log_msg = f"Log file: {self.log_file}"
-        self.logger.info(log_msg)
-        log_msg = f"Log level: {self.log_level}"
-        self.logger.info(log_msg)
-        log_msg = f"Log format: {self.log_format}"
-        self.logger.info(log_msg)
+        self.logger.info("Log file: %s", self.log_file)
+        self.logger.info("Log level: %s", self.log_level)
+        self.logger.info("Log format: %s", self.log_format)
         self.logger.info("Logger setup complete")
 
     def _setup_logger(self) -> PyLogger:
         """Sets up the logger with the specified log file, log level, and log format."""
         logger = getLogger(__name__)
         level = self._translate_loglevel()
-        file_handler = FileHandler(str(self.log_file))
-        file_handler.setLevel(level)
+        # gate on the logger itself so calls below the level return before a record is built
+        logger.setLevel(level)
 
-        # Create console handler
-        console_handler = StreamHandler()
-        console_handler.setLevel(level)
+        # Swap handlers on the shared logger instead of stacking new ones
+        # each time a Logger is constructed.
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+            handler.close()
+
+        file_handler: FileHandler | None
+        try:
+            file_handler = FileHandler(str(self.log_file))
+            file_handler.setLevel(level)
+        except OSError:
+            # unwritable/missing log directory: fall back to console only
+            file_handler = None
 
         # Create console handler
         console_handler = StreamHandler()
-        level_for_console = self._translate_loglevel()
-        console_handler.setLevel(level_for_console)
+        console_handler.setLevel(level)
 
         # Create formatter
         formatter = Formatter(self.log_format)
 
         # Add formatter to handlers
-        file_handler.setFormatter(formatter)
         console_handler.setFormatter(formatter)
 
         # Add handlers to logger
-        logger.addHandler(file_handler)
+        if file_handler is not None:
+            file_handler.setFormatter(formatter)
+            logger.addHandler(file_handler)
         logger.addHandler(console_handler)
 
         return logger
@@ -84,42 +93,38 @@ class Logger:
             result = logging.INFO
         return result
 
-    def debug(self, message: str) -> None:
+    def debug(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Logs a debug message."""
-        self.logger.debug(message)
+        self.logger.debug(message, *args, **kwargs)
 
-    def info(self, message: str) -> None:
+    def info(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Logs an info message."""
-        self.logger.info(message)
+        self.logger.info(message, *args, **kwargs)
 
-    def warning(self, message: str) -> None:
+    def warning(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Logs a warning message."""
-        self.logger.warning(message)
+        self.logger.warning(message, *args, **kwargs)
 
-    def error(self, message: str) -> None:
+    def error(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Logs an error message."""
-        self.logger.error(message)
+        self.logger.error(message, *args, **kwargs)
 
-    def critical(self, message: str) -> None:
+    def critical(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Logs a critical message."""
-        self.logger.critical(message)
+        self.logger.critical(message, *args, **kwargs)
 
-    def exception(self, message: str) -> None:
+    def exception(self, message: str, *args: Any, **kwargs: Any) -> None:
         """Logs an exception message with traceback."""
-        self.logger.exception(message)
+        self.logger.exception(message, *args, **kwargs)
 
     def set_log_file(self, log_file: str) -> None:
         """Sets the log file for the logger."""
         self.log_file = log_file
 
-        for handler in self.logger.handlers:
-            handler.close()
-            self.logger.removeHandler(handler)
-
+        # _setup_logger() closes and removes the current handlers before adding new ones
         self.logger = self._setup_logger()
 
-        log_msg = f"Log file set to {log_file}"
-        self.logger.info(log_msg)
+        self.logger.info("Log file set to %s", log_file)
 
     def set_log_format(self, log_format: str) -> None:
         """Sets the log format for the logger."""
@@ -128,8 +133,11 @@ class Logger:
         for handler in self.logger.handlers:
             handler.setFormatter(Formatter(log_format))
 
-        log_msg = f"Log format set to {log_format}"
-        self.logger.info(log_msg)
+        self.logger.info("Log format set to %s", log_format)
+
+    def is_enabled_for(self, level: int) -> bool:
+        """True when a message at level would be emitted; guards costly debug payloads."""
+        return self.logger.isEnabledFor(level)
 
     def get_log_file(self) -> str:
         """Returns the log file for the logger."""
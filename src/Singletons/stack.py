@@ -22,52 +22,77 @@ It is used to keep track of various statistics related to the application.
 
 from __future__ import annotations
 
+from array import array
+from collections import Counter
 from typing import ClassVar, Dict
 
+from core.enums import Stat
+
+_STAT_BY_NAME: Dict[str, Stat] = {stat.name.lower(): stat for stat in Stat}
+
 
 class Stack:
     """A stack of stats for the AMM application.
     This is a singleton class that provides a global access point to the stats stack.
     It is used to keep track of various statistics related to the application.
+
+    Counters listed in `Stat` live in a fixed int64 array; any other name
+    falls back to a Counter.
     """
 
+    __slots__ = ("_initialized", "_counters", "_stats")
+
     _instance: ClassVar["Stack" | None] = None
 
     def __new__(cls) -> "Stack":
         if cls._instance is None:
             cls._instance = super(Stack, cls).__new__(cls)
-            cls._instance._stats = {}
         return cls._instance
 
     def __init__(self) -> None:
         """Initialize the stack."""
         if not hasattr(self, "_initialized"):
             self._initialized = True
-            self._stats: Dict[str, int] = {}
+            self._counters: array[int] = array("q", [0] * len(Stat))
+            self._stats: Counter[str] = Counter()
 
-    def add_counter(self, name: str, value: int = 1) -> int:
+    def add_counter(self, name: str | Stat, value: int = 1) -> int:
         """Add a counter to the stack."""
-        if name not in self._stats:
-            self._stats[name] = 0
-        self._stats[name] += value
-        return self._stats[name]
+        stat = name if isinstance(name, Stat) else _STAT_BY_NAME.get(name)
+        if stat is not None:
+            self._counters[stat] += value
+            return self._counters[stat]
+        stats = self._stats
+        stats[name] += value
+        return stats[name]
 
-    def get_counter(self, name: str) -> int:
+    def get_counter(self, name: str | Stat) -> int:
         """Get the value of a counter from the stack."""
-        return self._stats.get(name, 0)
+        stat = name if isinstance(name, Stat) else _STAT_BY_NAME.get(name)
+        if stat is not None:
+            return self._counters[stat]
+        return self._stats[name]
 
-    def reset_counter(self, name: str) -> int:
+    def reset_counter(self, name: str | Stat) -> int:
         """Reset the value of a counter in the stack."""
+        stat = name if isinstance(name, Stat) else _STAT_BY_NAME.get(name)
+        if stat is not None:
+            self._counters[stat] = 0
+            return 0
         if name in self._stats:
             self._stats[name] = 0
-        return self._stats[name]
+        return 0
 
     def reset_all(self) -> Dict[str, int]:
         """Reset all counters in the stack."""
+        for stat in Stat:
+            self._counters[stat] = 0
         for name in self._stats:
             self._stats[name] = 0
-        return self._stats
+        return self.get_all()
 
     def get_all(self) -> Dict[str, int]:
         """Get all counters from the stack."""
-        return self._stats
+        stats = {stat.name.lower(): self._counters[stat] for stat in Stat}
+        stats.update(self._stats)
+        return stats
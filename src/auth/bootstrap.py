@@ -65,7 +65,7 @@ async def ensure_bootstrap_admin(logger: Logger | None = None) -> None:
 
     pwd_hash = hash_password(password)
 
-    async for session in DBInstance.get_session():
+    async with DBInstance.session_scope() as session:
         existing = await _find_user(session, username=username, email=email)
         if existing is None:
             user = DBUser(
@@ -33,7 +33,7 @@ async def get_current_user(
     except JWTError as e:
         raise HTTPException(status_code=401, detail="Invalid token") from e
 
-    async for session in DBInstance.get_session():
+    async with DBInstance.session_scope() as session:
         user = await session.get(DBUser, user_id)
         if not user or not user.is_active:
             raise HTTPException(status_code=401, detail="Inactive user")
@@ -55,7 +55,7 @@ async def get_current_user_optional(request: Request) -> Optional[DBUser]:
         user_id = int(payload.get("sub"))  # type: ignore[arg-type]
     except Exception:
         return None
-    async for session in DBInstance.get_session():
+    async with DBInstance.session_scope() as session:
         user = await session.get(DBUser, user_id)
         if not user or not user.is_active:
             return None
@@ -1,5 +1,8 @@
 # defaults.py
 
+from types import MappingProxyType
+from typing import Any
+
 CONFIG_VERSION = "1.3"
 
 DEFAULT_CONFIG = {
@@ -35,3 +38,16 @@ DEFAULT_CONFIG = {
         "backend_url": "http://localhost:8000",
     },
 }
+
+
+def _freeze(value: Any) -> Any:
+    """Read-only view of a config tree: dicts become mappingproxies, lists tuples."""
+    if type(value) is dict:
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if type(value) is list:
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+# Frozen so nothing can mutate the shared defaults; merge_configs thaws a copy.
+DEFAULT_CONFIG = _freeze(DEFAULT_CONFIG)
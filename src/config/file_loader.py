@@ -5,26 +5,37 @@ try:
     import tomli_w  # type: ignore
 except Exception:  # pragma: no cover - optional dependency
     tomli_w = None
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+    orjson = None
 from pathlib import Path
 import logging
 from typing import Dict, Any
 import json
 
+from pydantic import BaseModel
+
 ENCODING = "utf-8"
+# orjson can only indent by 2; every JSON writer uses the same so files don't churn
+JSON_INDENT = 2
 logger = logging.getLogger("AMM.Config")
 
 
 def read_config_file(path: Path) -> Dict[str, Any]:
-    if not path.exists():
+    try:
+        raw = path.read_bytes()
+    except FileNotFoundError:
         logger.warning(f"Config file missing: {path}")
         return {}
+    except Exception as e:
+        logger.error(f"Cannot read config file: {e}")
+        return {}
 
     try:
         if path.suffix.lower() == ".json":
-            with path.open("r", encoding=ENCODING) as f:
-                return json.load(f)
-        with path.open("rb") as f:
-            return tomllib.load(f)
+            return orjson.loads(raw) if orjson is not None else json.loads(raw)
+        return tomllib.loads(raw.decode(ENCODING))
     except Exception as e:
         logger.error(f"Cannot read config file: {e}")
         return {}
@@ -34,8 +45,10 @@ def write_config_file(path: Path, cfg: Dict[str, Any]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     try:
         if path.suffix.lower() == ".json":
-            with path.open("w", encoding=ENCODING) as f:
-                json.dump(cfg, f, indent=4)
+            if orjson is not None:
+                path.write_bytes(orjson.dumps(cfg, option=orjson.OPT_INDENT_2))
+            else:
+                path.write_text(json.dumps(cfg, indent=JSON_INDENT, ensure_ascii=False), encoding=ENCODING)
             return
         if tomli_w is None:
             raise RuntimeError("tomli_w is required to write TOML config files.")
@@ -43,3 +56,15 @@ def write_config_file(path: Path, cfg: Dict[str, Any]) -> None:
             tomli_w.dump(cfg, f)
     except Exception as e:
         logger.error(f"Cannot write config file: {e}")
+
+
+def write_config_model(path: Path, model: BaseModel) -> None:
+    """Write a config model; JSON files are serialized straight from the model."""
+    if path.suffix.lower() != ".json":
+        write_config_file(path, model.model_dump(by_alias=True))
+        return
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        path.write_text(model.model_dump_json(by_alias=True, indent=JSON_INDENT), encoding=ENCODING)
+    except Exception as e:
+        logger.error(f"Cannot write config file: {e}")
@@ -3,14 +3,19 @@
 from __future__ import annotations
 
 import asyncio
+import copy
 import logging
 from pathlib import Path
 from threading import Lock
 from typing import Any, ClassVar, Dict, Optional, TypeVar, cast
 
+from pydantic import BaseModel
+
+from core.exceptions import InvalidValueError
+
 from .models import AppConfig
 from .defaults import DEFAULT_CONFIG
-from .file_loader import read_config_file, write_config_file
+from .file_loader import read_config_file, write_config_file, write_config_model
 from .env_loader import apply_environment
 from .merger import merge_configs
 from .watcher import watch_file
@@ -21,6 +26,16 @@ logger = logging.getLogger("AMM.Config")
 
 T = TypeVar("T")
 
+# Validated once; fallbacks hand out deep copies instead of re-validating.
+_DEFAULT_APP_CONFIG = AppConfig(**DEFAULT_CONFIG)
+
+
+def _detached(value: Any) -> Any:
+    """Copy of a container value from the shared dump cache, so callers can't mutate it."""
+    if type(value) is dict or type(value) is list:
+        return copy.deepcopy(value)
+    return value
+
 
 class AsyncConfigManager:
     _instance: ClassVar[Optional["AsyncConfigManager"]] = None
@@ -50,7 +65,11 @@ class AsyncConfigManager:
         self._thread_lock = Lock()
 
         self.config_file = Path(config_file) if config_file else Path("config.json")
-        self._config: AppConfig = AppConfig(**DEFAULT_CONFIG)
+        self._config: AppConfig = _DEFAULT_APP_CONFIG.model_copy(deep=True)
+        self._dump_cache: Optional[Dict[str, Any]] = None
+        self._resolved_paths: Optional[Dict[str, Path]] = None
+        # input of the last successful validation; lets no-op reloads skip it
+        self._validated_source: Optional[Dict[str, Any]] = None
 
         self.reload_sync()   # initial load
         self._watch_task: Optional[asyncio.Task[Any]] = None
@@ -70,13 +89,18 @@ class AsyncConfigManager:
             # 3) apply migrations
             migrated = self._apply_migrations(merged)
 
-            # 4) revalidate
-            try:
-                self._config = AppConfig(**migrated)
-                logger.info("Configuration loaded successfully.")
-            except Exception as e:
-                logger.error(f"Config invalid: {e}")
-                self._config = AppConfig(**DEFAULT_CONFIG)
+            # 4) revalidate, unless nothing changed since the last load
+            if migrated != self._validated_source:
+                try:
+                    self._config = AppConfig(**migrated)
+                    self._validated_source = migrated
+                    logger.info("Configuration loaded successfully.")
+                except Exception as e:
+                    logger.error(f"Config invalid: {e}")
+                    self._config = _DEFAULT_APP_CONFIG.model_copy(deep=True)
+                    self._validated_source = None
+                self._dump_cache = None
+                self._resolved_paths = None
 
             # 5) write back if migrations changed anything
             if migrated != file_cfg:
@@ -98,8 +122,7 @@ class AsyncConfigManager:
         Thread-safe.
         """
         with self._thread_lock:
-            data = self._config.model_dump(by_alias=True)
-            write_config_file(self.config_file, data)
+            write_config_model(self.config_file, self._config)
             logger.info("Configuration saved to disk.")
 
     async def save(self) -> None:
@@ -117,25 +140,40 @@ class AsyncConfigManager:
         Fully async and thread-safe.
         """
         async with self._async_lock:
-            # update the in-memory model
-            data = self._config.model_dump(by_alias=True)
-            if section not in data:
-                data[section] = {}
-
-            if isinstance(data[section], dict):
-                data[section][key] = value
+            section_model = getattr(self._config, section, None)
+            if isinstance(section_model, BaseModel):
+                # revalidate only the touched section and swap it in
+                section_data = section_model.model_dump(by_alias=True)
+                section_data[key] = value
+                new_section = type(section_model).model_validate(section_data)
+                self._config = self._config.model_copy(update={section: new_section})
             else:
-                data[section] = {key: value}
-
-            # validate
-            new_cfg = AppConfig(**data)
-            self._config = new_cfg
+                data = self._config.model_dump(by_alias=True)
+                if isinstance(data.get(section), dict):
+                    data[section][key] = value
+                else:
+                    data[section] = {key: value}
+                self._config = AppConfig(**data)
+            self._dump_cache = None
+            self._resolved_paths = None
+            self._validated_source = None
 
             # save to disk
-            await asyncio.to_thread(write_config_file, self.config_file, data)
+            await asyncio.to_thread(self._patch_file, section, key, value)
 
             logger.info(f"Config updated: {section}.{key} = {value}")
 
+    def _patch_file(self, section: str, key: str, value: Any) -> None:
+        """Write one key into the on-disk config, leaving the rest of the file as is."""
+        with self._thread_lock:
+            data = read_config_file(self.config_file) or self._config.model_dump(by_alias=True)
+            section_data = data.get(section)
+            if isinstance(section_data, dict):
+                section_data[key] = value
+            else:
+                data[section] = {key: value}
+            write_config_file(self.config_file, data)
+
     # -----------------------------------------------------
     # Reset to defaults
     # -----------------------------------------------------
@@ -143,9 +181,11 @@ class AsyncConfigManager:
     async def save_defaults(self) -> None:
         """Replace config with defaults and save."""
         async with self._async_lock:
-            self._config = AppConfig(**DEFAULT_CONFIG)
-            data = self._config.model_dump(by_alias=True)
-            await asyncio.to_thread(write_config_file, self.config_file, data)
+            self._config = _DEFAULT_APP_CONFIG.model_copy(deep=True)
+            self._dump_cache = None
+            self._resolved_paths = None
+            self._validated_source = None
+            await asyncio.to_thread(write_config_model, self.config_file, self._config)
             logger.info("Configuration reset to defaults and saved.")
 
     # -----------------------------------------------------
@@ -164,12 +204,29 @@ class AsyncConfigManager:
     def model(self) -> AppConfig:
         return self._config
 
+    def _as_dict(self) -> Dict[str, Any]:
+        """Aliased dump of the current model, cached until the model changes."""
+        data = self._dump_cache
+        if data is None:
+            data = self._dump_cache = self._config.model_dump(by_alias=True)
+        return data
+
+    def _resolve_paths(self) -> Dict[str, Path]:
+        """Join every paths entry onto base once, cached until the model changes."""
+        resolved = self._resolved_paths
+        if resolved is None:
+            paths = self._as_dict()["paths"]
+            base = Path(paths["base"])
+            resolved = {key: base / value for key, value in paths.items() if key != "base"}
+            resolved["base"] = base
+            self._resolved_paths = resolved
+        return resolved
+
     def get_path(self, key: str) -> Path:
-        base = Path(self._config.paths.base)
-        if key == "base":
-            return base
-        attr = "import_" if key == "import" else key
-        return base / getattr(self._config.paths, attr)
+        try:
+            return self._resolve_paths()[key]
+        except KeyError:
+            raise InvalidValueError(f"Unknown path key: {key}") from None
 
     def get(self, section: str, key: Optional[str] = None, default: Any = None) -> Any:
         """
@@ -186,36 +243,42 @@ class AsyncConfigManager:
                 sect, k = section.split(".", 1)
                 return self.get_value(sect, k, default)
 
-            data = self._config.model_dump(by_alias=True)
+            data = self._as_dict()
 
             # top-level scalar field
             if section in data and not isinstance(data[section], dict):
-                return data.get(section, default)
+                return _detached(data[section])
 
             # search within sections
             for sect, values in data.items():
                 if isinstance(values, dict) and section in values:
-                    return values.get(section, default)
+                    return _detached(values[section])
 
             return default
 
         return self.get_value(section, key, default)
 
     def get_value(self, section: str, key: str, default: Optional[T] = None) -> Optional[T]:
-        data = self._config.model_dump(by_alias=True)
+        data = self._as_dict()
         section_value = data.get(section)
         if isinstance(section_value, dict):
-            return cast(Optional[T], section_value.get(key, default))
+            if key in section_value:
+                return cast(Optional[T], _detached(section_value[key]))
+            return default
         return default
 
     def get_string(self, section: str, key: str, default: Optional[str] = None) -> str:
         value = self.get_value(section, key, default)
+        if type(value) is str:
+            return value
         if value is None:
             return "" if default is None else default
         return str(value)
 
     def get_int(self, section: str, key: str, default: int = 0) -> int:
         value = self.get_value(section, key, default)
+        if type(value) is int:
+            return value
         try:
             return int(value)  # type: ignore[arg-type]
         except (TypeError, ValueError):
@@ -223,15 +286,15 @@ class AsyncConfigManager:
 
     def get_bool(self, section: str, key: str, default: bool = False) -> bool:
         value = self.get_value(section, key, default)
-        if isinstance(value, bool):
+        if type(value) is bool:
             return value
-        if isinstance(value, str):
+        if type(value) is str:
             return value.strip().lower() in {"1", "true", "yes", "on"}
         return bool(value) if value is not None else default
 
     def get_list(self, section: str, key: str, default: Optional[list[Any]] = None) -> list[Any]:
         value = self.get_value(section, key, default or [])
-        if isinstance(value, list):
+        if type(value) is list:
             return value
         if value is None:
             return default or []
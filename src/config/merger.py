@@ -1,13 +1,38 @@
 # merger.py
 
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
 
 
-def merge_configs(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
-    result = dict(base)
-    for k, v in override.items():
-        if isinstance(v, dict) and isinstance(result.get(k), dict):
-            result[k] = merge_configs(result[k], v)
-        else:
-            result[k] = v
+def _clone(value: Any) -> Any:
+    """
+    Copy a config tree into plain dicts/lists; scalars are immutable and shared.
+    Frozen mappingproxy/tuple nodes (see defaults.DEFAULT_CONFIG) are thawed.
+    """
+    t = type(value)
+    if t is dict or t is MappingProxyType:
+        return {k: _clone(v) for k, v in value.items()}
+    if t is list or t is tuple:
+        return [_clone(v) for v in value]
+    return value
+
+
+def _merge(dst: Dict[str, Any], src: Dict[str, Any]) -> None:
+    """
+    Merge src into dst in place; only sections present on both sides are walked.
+    """
+    stack = [(dst, src)]
+    while stack:
+        d, s = stack.pop()
+        for k, v in s.items():
+            dv = d.get(k)
+            if type(v) is dict and type(dv) is dict:
+                stack.append((dv, v))
+            else:
+                d[k] = v
+
+
+def merge_configs(base: Mapping[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+    result = _clone(base)
+    _merge(result, override)
     return result
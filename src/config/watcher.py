@@ -3,27 +3,77 @@
 from __future__ import annotations
 
 from typing import Awaitable, Callable
+import asyncio
 import logging
+import os
 from pathlib import Path
 
-try:
-    from watchfiles import awatch  # type: ignore
-except ModuleNotFoundError:  # pragma: no cover
-    awatch = None
-
 logger = logging.getLogger("AMM.ConfigWatcher")
 
 
-async def watch_file(path: Path, callback: Callable[[], Awaitable[None]]) -> None:
+def _signature(path: str) -> tuple[int, int] | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+async def watch_file(
+    path: Path,
+    callback: Callable[[], Awaitable[None]],
+    *,
+    debounce_ms: int = 1600,
+    step_ms: int = 200,
+) -> None:
     """
     Watches config file and calls the callback on change.
+
+    Events arriving within ``step_ms`` of each other are coalesced into a
+    single reload, and batches that leave the file's mtime/size untouched
+    (metadata-only events from editors) are skipped.
     """
+    # Imported here so processes that never watch don't pay for watchfiles.
+    try:
+        from watchfiles import awatch  # type: ignore
+    except ModuleNotFoundError:  # pragma: no cover
+        awatch = None
+
     if awatch is None:
-        logger.warning("watchfiles not installed; config watching disabled.")
+        logger.info("watchfiles not installed; polling config file instead.")
+        await _poll_file(path, callback)
         return
-    async for _ in awatch(path):
-        logger.info("Detected config change, reloading...")
-        try:
-            await callback()
-        except Exception as e:
-            logger.error(f"Error applying reload: {e}")
+    target = os.fspath(path)
+    last = _signature(target)
+    async for _ in awatch(target, debounce=debounce_ms, step=step_ms):
+        current = _signature(target)
+        if current == last:
+            continue
+        last = current
+        await _reload(callback)
+
+
+async def _poll_file(
+    path: Path,
+    callback: Callable[[], Awaitable[None]],
+    interval: float = 0.5,
+) -> None:
+    """
+    Stat-poll a single file; cheaper than an observer for one small config.
+    """
+    target = os.fspath(path)
+    last = _signature(target)
+    while True:
+        await asyncio.sleep(interval)
+        current = _signature(target)
+        if current != last:
+            last = current
+            await _reload(callback)
+
+
+async def _reload(callback: Callable[[], Awaitable[None]]) -> None:
+    logger.info("Detected config change, reloading...")
+    try:
+        await callback()
+    except Exception as e:
+        logger.error(f"Error applying reload: {e}")
@@ -54,7 +54,7 @@ class ConcurrencyMixin:
         """
         # cooldown check
         if self.is_in_cooldown():
-            self.logger.debug(f"{getattr(self, 'name', type(self).__name__)}: in cooldown until {self._cooldown_until}")
+            self.logger.debug("%s: in cooldown until %s", getattr(self, 'name', type(self).__name__), self._cooldown_until)
             return False
 
         # exclusive takes global lock
@@ -62,7 +62,7 @@ class ConcurrencyMixin:
             # block until acquired — this is the design: exclusive must wait
             try:
                 await ConcurrencyMixin._exclusive_lock.acquire()
-                self.logger.debug(f"{getattr(self, 'name', type(self).__name__)}: acquired exclusive lock")
+                self.logger.debug("%s: acquired exclusive lock", getattr(self, 'name', type(self).__name__))
                 return True
             except Exception as e:
                 self.logger.exception(f"acquire_concurrency (exclusive) error: {e}")
@@ -78,7 +78,7 @@ class ConcurrencyMixin:
 
             try:
                 await sem.acquire()
-                self.logger.debug(f"{getattr(self, 'name', type(self).__name__)}: acquired heavy_io slot")
+                self.logger.debug("%s: acquired heavy_io slot", getattr(self, 'name', type(self).__name__))
                 return True
             except Exception as e:
                 self.logger.exception(f"acquire_concurrency (heavy_io) error: {e}")
@@ -99,7 +99,7 @@ class ConcurrencyMixin:
         try:
             if getattr(self, "exclusive", False) and ConcurrencyMixin._exclusive_lock.locked():
                 ConcurrencyMixin._exclusive_lock.release()
-                self.logger.debug(f"{getattr(self, 'name', type(self).__name__)}: released exclusive lock")
+                self.logger.debug("%s: released exclusive lock", getattr(self, 'name', type(self).__name__))
         except RuntimeError:
             # already released or not owned by this loop
             pass
@@ -108,7 +108,7 @@ class ConcurrencyMixin:
         try:
             if getattr(self, "heavy_io", False) and ConcurrencyMixin._heavy_io_semaphore is not None:
                 ConcurrencyMixin._heavy_io_semaphore.release()
-                self.logger.debug(f"{getattr(self, 'name', type(self).__name__)}: released heavy_io slot")
+                self.logger.debug("%s: released heavy_io slot", getattr(self, 'name', type(self).__name__))
         except ValueError:
             # semaphore release mismatch — ignore
             pass
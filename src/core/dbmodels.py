@@ -124,7 +124,7 @@ class DBTask(AutoFetchable, SQLModel, table=True):
     __tablename__ = "tasks"  # type: ignore
 
     id: int = Field(default=None, sa_type=Integer, primary_key=True, unique=True)
-    task_id: str = Field(default="", nullable=False, sa_type=String(40), max_length=40)
+    task_id: str = Field(default="", nullable=False, index=True, sa_type=String(40), max_length=40)
     start_time: dt.datetime = Field(default=None)
     end_time: Optional[dt.datetime] = Field(default=None, sa_column_kwargs={"nullable": True})
     duration: int = Field(default=0, sa_type=Integer)
@@ -134,7 +134,7 @@ class DBTask(AutoFetchable, SQLModel, table=True):
     kwargs: str = Field(default="", sa_type=String(1024), max_length=1024)
     result: str = Field(default="", sa_type=String(1024), max_length=1024)
     error: str = Field(default="", sa_type=String(1024), max_length=1024)
-    status: TaskStatus = Field(default=TaskStatus.PENDING)
+    status: TaskStatus = Field(default=TaskStatus.PENDING, index=True)
     task_type: TaskType = Field(default=TaskType.CUSTOM)
 
     batch_files: list["DBFile"] = Relationship(back_populates="task")
@@ -337,7 +337,7 @@ class DBTaskStat(SQLModel, table=True):
     __tablename__ = "task_stats"  # type: ignore
 
     id: Optional[int] = Field(default=None, primary_key=True)
-    task_type: TaskType = Field(index=True)
+    task_type: TaskType = Field(index=True, unique=True)
 
     last_run: dt.datetime = Field(default_factory=lambda: dt.datetime.now(dt.timezone.utc))
 
@@ -346,6 +346,7 @@ class DBTaskStat(SQLModel, table=True):
     trimmed: int = Field(default=0)
     deduped: int = Field(default=0)
 
+    total_files: int = Field(default=0)
     total_playtime: int = Field(default=0)  # in seconds
     average_playtime: int = Field(default=0)
     total_filesize: int = Field(default=0)  # in bytes
@@ -469,7 +470,7 @@ class DBTrack(ItemBase, table=True):
     task_id: int = Field(default=None, foreign_key="tasks.id")
     key_id: Optional[int] = Field(default=None, foreign_key="keys.id")
     genre_id: Optional[int] = Field(default=None, foreign_key="genres.id")
-    files: "DBFile" = Relationship(back_populates="track")
+    files: list["DBFile"] = Relationship(back_populates="track")
     album_tracks: "DBAlbumTrack" = Relationship(back_populates="track")
     performers: list["DBPerson"] = Relationship(
         back_populates="tracks", link_model=DBTrackPerson
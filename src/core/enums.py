@@ -141,6 +141,17 @@ class CodecPriority(IntEnum):
     UNKNOWN = 0
 
 
+class Stat(IntEnum):
+    """Well-known stats counters; values index the Stack counter array."""
+
+    ALL_FILES = 0
+    ALL_FOLDERS = 1
+    REMOVED_FILES = 2
+    SCANNED_FOLDERS = 3
+    SCANNED_FILES = 4
+    IMPORTED_FILES = 5
+
+
 class ArtType(StrEnum):
     """Enum for different types of art."""
 
@@ -65,7 +65,7 @@ class Track(BaseModel):
     @classmethod
     async def from_id(cls, track_id: int) -> "Track":
         """Async loader for Track from the database."""
-        async for session in DBInstance.get_session():
+        async with DBInstance.session_scope() as session:
             result = await session.exec(
                 select(DBTrack)
                 .where(DBTrack.id == track_id)
@@ -78,7 +78,6 @@ class Track(BaseModel):
                 )
             )
             trackdata = result.first()
-            await session.close()
             if not trackdata:
                 raise InvalidValueError(
                     f"Track with id {track_id} not found in the database."
@@ -10,6 +10,8 @@ from config import Config
 class PluginBase(ABC):
     """Base class for all AMM plugins."""
 
+    __slots__ = ()
+
     plugin_type: ClassVar[Optional[PluginType]] = None
     name: ClassVar[Optional[str]] = None
     stage_type: ClassVar[Optional[StageType]] = None
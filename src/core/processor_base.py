@@ -83,7 +83,7 @@ class ProcessorBase(ConcurrencyMixin):
     # emission API
     def emit_task(self, *, task_type: TaskType, batch: Optional[Any] = None, priority: int = 10, extra: Optional[dict] = None) -> None:
         self._emitted_tasks.append({"task_type": task_type, "batch": batch, "priority": priority, "extra": extra or {}})
-        self.logger.debug(f"{self.name}: emitted task {task_type.name}")
+        self.logger.debug("%s: emitted task %s", self.name, task_type.name)
 
     def collect_emitted_tasks(self) -> list[Dict[str, Any]]:
         return self._emitted_tasks
@@ -102,6 +102,17 @@ class PluginRegistry:
             coro = [self._instantiate_audioutil(n) for n in list(self._audioutil_classes.keys())]
             await asyncio.gather(*coro)
 
+    async def close_all_audioutils(self) -> None:
+        """Await close() on every audio util instance that has one (e.g. pooled HTTP sessions)."""
+        for name, inst in list(self._audioutil_instances.items()):
+            close_fn = getattr(inst, "close", None)
+            if close_fn is None or not inspect.iscoroutinefunction(close_fn):
+                continue
+            try:
+                await close_fn()
+            except Exception as e:
+                logger.error(f"Failed to close audioutil {name}: {e}")
+
     # ---------------- factories (DI) ----------------
     async def create_task(self, name: str, *, batch: Any = None, **kwargs: Any) -> Any:
         """
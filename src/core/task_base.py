@@ -7,10 +7,13 @@
 from __future__ import annotations
 
 import time
+from collections.abc import Sized
 import datetime as dt
-from typing import Any, Optional, Callable, ClassVar, TypeVar
+from typing import Any, Optional, Callable, ClassVar, Sequence, TypeVar
 from abc import ABCMeta, abstractmethod
 
+from sqlmodel import select
+
 from src.Singletons.logger import Logger
 
 from .enums import PluginType, TaskStatus, StageType, TaskType
@@ -45,6 +48,14 @@ class TaskBase(PluginBase, metaclass=ABCMeta):
     heavy_io: ClassVar[bool | None] = None
 
     # --- Instance attributes ---
+    # Slotted so the base state lives in a fixed layout; subclasses keep a __dict__
+    # for their own attributes.
+    __slots__ = (
+        "_status", "_old_status", "_start_time", "_end_time", "_duration", "_progress",
+        "_result", "_error", "_task_id", "_target", "_completed", "_status_message",
+        "_batch", "_batch_len", "config", "logger", "kwargs", "processed",
+    )
+
     _status: TaskStatus
     _old_status: TaskStatus
     _start_time: float
@@ -55,7 +66,6 @@ class TaskBase(PluginBase, metaclass=ABCMeta):
     _error: str
     _task_id: str
 
-    batch: list[Any] | dict[Any, Any] | None
     config: Any
     logger: Any
 
@@ -115,16 +125,26 @@ class TaskBase(PluginBase, metaclass=ABCMeta):
         self._old_status = self._status
         self._status = value
 
+    @property
+    def batch(self) -> list[Any] | dict[Any, Any] | None:
+        return self._batch
+
+    @batch.setter
+    def batch(self, value: list[Any] | dict[Any, Any] | None) -> None:
+        # Sized once per assignment; set_progress runs once per processed item.
+        self._batch = value
+        self._batch_len = len(value) if isinstance(value, Sized) else 0
+
     @property
     def progress(self) -> float:
         return self._progress
 
     def set_progress(self, step: int | float = 1) -> None:
         self.processed += step
-        total = len(self.batch) if self.batch else 0
+        total = self._batch_len
         if total > 0:
             self._progress = (self.processed / total) * 100
-        self.logger.debug(f"{self.name}: progress={self._progress:.2f}%")
+        self.logger.debug("%s: progress=%.2f%%", self.name, self._progress)
 
     def set_start_time(self) -> None:
         self._start_time = time.time()
@@ -135,9 +155,7 @@ class TaskBase(PluginBase, metaclass=ABCMeta):
         self._duration = self._end_time - self._start_time
         if self.status != TaskStatus.FAILED:
             self.status = TaskStatus.COMPLETED
-        self.logger.debug(
-            f"{self.name}: completed in {self._duration:.2f}s"
-        )
+        self.logger.debug("%s: completed in %.2fs", self.name, self._duration)
 
     def set_error(self, message: str) -> None:
         self._error = message
@@ -188,24 +206,47 @@ class TaskBase(PluginBase, metaclass=ABCMeta):
         Mark this task as completed for a file.
         If this StageType is now fully satisfied, advance stage_type.
         """
-        from core.dbmodels import DBFile
+        from core.dbmodels import DBFile  # core.dbmodels imports this module
 
         dbfile = await session.get(DBFile, file_id)
         if not dbfile:
-            self.logger.error(f"{self.name}: File {file_id} not found.")
+            self.logger.error("%s: File %s not found.", self.name, file_id)
             return
 
         # mark this exact task as completed
         new = dbfile.mark_task_completed(self.name)
 
         if new:
-            self.logger.debug(f"{self.name}: Marked file {file_id} done for task.")
+            self.logger.debug("%s: Marked file %s done for task.", self.name, file_id)
 
         # Now check whether stage should advance
         await self._try_advance_stage(dbfile, session)
 
         session.add(dbfile)
 
+    async def finalize_files(self, file_ids: Sequence[int], session: AsyncSessionLike) -> None:
+        """
+        finalize_file for many files: they are loaded with one SELECT ... IN, and the
+        resulting changes go out as executemany UPDATEs when the session flushes.
+        """
+        from core.dbmodels import DBFile  # core.dbmodels imports this module
+
+        if not file_ids:
+            return
+
+        result = await session.exec(select(DBFile).where(DBFile.id.in_(file_ids)))  # type: ignore
+        found = 0
+        for dbfile in result.all():
+            found += 1
+            dbfile.mark_task_completed(self.name)
+            await self._try_advance_stage(dbfile, session)
+            session.add(dbfile)
+
+        if found < len(file_ids):
+            self.logger.error(
+                "%s: %d of %d files not found.", self.name, len(file_ids) - found, len(file_ids)
+            )
+
     async def _try_advance_stage(self, dbfile: Any, session: AsyncSessionLike) -> None:
         """
         Advance stage_type only if:
@@ -241,9 +282,14 @@ class TaskBase(PluginBase, metaclass=ABCMeta):
         
     async def update_file_stage(self, file_id: int, session: AsyncSessionLike) -> None:
         """Mark this file as having completed this task, and update stage if needed."""
-        self.logger.debug(f"{self.name}: Updating file {file_id} stage...")
+        self.logger.debug("%s: Updating file %s stage...", self.name, file_id)
         await self.finalize_file(file_id, session) # type: ignore
 
+    async def update_file_stages(self, file_ids: Sequence[int], session: AsyncSessionLike) -> None:
+        """Batch form of update_file_stage."""
+        self.logger.debug("%s: Updating stage of %d files...", self.name, len(file_ids))
+        await self.finalize_files(file_ids, session)
+
     def set_completed(self, message: str = "No message given...") -> None:
         self._result = True
         self._progress = 100.0
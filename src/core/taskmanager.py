@@ -3,7 +3,8 @@ from __future__ import annotations
 import asyncio
 import os
 import json
-from typing import Type, Optional, Any, Dict
+from threading import Lock
+from typing import Type, Optional, Any, ClassVar, Dict
 
 from sqlmodel import select
 from Singletons import DBInstance, Logger
@@ -23,13 +24,20 @@ class TaskManager:
     and respects the system-wide exclusive lock.
     """
 
-    _instance = None
+    _instance: ClassVar[Optional["TaskManager"]] = None
+    _instance_lock: ClassVar[Lock] = Lock()
 
     def __new__(cls, *args: Any, **kwargs: Any) -> "TaskManager":
-        if cls._instance is None:
-            cls._instance = super(TaskManager, cls).__new__(cls)
-            cls._instance._initialize()
-        return cls._instance
+        instance = cls._instance
+        if instance is not None:
+            return instance
+        with cls._instance_lock:
+            if cls._instance is None:
+                instance = super(TaskManager, cls).__new__(cls)
+                instance._initialize()
+                # published once initialised: the unlocked fast path never sees it half-built
+                cls._instance = instance
+            return cls._instance
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
         # Allow legacy callers to pass args; singleton init happens in __new__.
@@ -167,7 +175,7 @@ class TaskManager:
             return
         if not getattr(task, "task_id", None):
             raise ValueError("Task must have task_id before saving")
-        async for session in self.db.get_session():
+        async with self.db.session_scope() as session:
             result = await session.exec(select(DBTask).where(DBTask.task_id == task.task_id))
             db_task = result.first()
             if db_task is None:
@@ -1,12 +1,10 @@
 from __future__ import annotations
 
+from contextlib import AbstractAsyncContextManager
 from pathlib import Path
-from typing import Any, AsyncGenerator, Awaitable, Mapping, Protocol, Sequence, TYPE_CHECKING
+from typing import Any, AsyncGenerator, Awaitable, Iterable, Mapping, Protocol, Sequence
 
-from core.enums import ArtType, Codec
-
-if TYPE_CHECKING:
-    from core.dbmodels import DBFile
+from core.enums import ArtType, Codec, Stat
 
 
 class AsyncSessionLike(Protocol):
@@ -83,13 +81,17 @@ class GetFileTypeProtocol(Protocol):
 
 
 class AlbumArtCheckerUtilProtocol(Protocol):
-    async def get_files_with_album_art(self) -> list[DBFile]: ...
+    async def get_file_ids_with_album_art(self) -> list[int]: ...
 
 
 class StackProtocol(Protocol):
-    def add_counter(self, name: str, value: int = 1) -> None: ...
+    def add_counter(self, name: str | Stat, value: int = 1) -> int: ...
 
 
 class DBInterface(Protocol):
     def get_session(self) -> AsyncGenerator[AsyncSessionLike, None]: ...
+    def session_scope(self) -> AbstractAsyncContextManager[AsyncSessionLike]: ...
     async def register_picture(self, mbid: str, art_type: ArtType, save_path: Path) -> None: ...
+    async def register_pictures(self, pictures: Iterable[tuple[str, ArtType, Path]]) -> list[str]: ...
+    def remember_file(self, file_path: str, now: float | None = None) -> None: ...
+    def forget_file(self, file_path: str | None = None) -> None: ...
@@ -147,6 +147,12 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     except Exception as e:
         logger.exception(f"PlayerService shutdown error: {e}")
 
+    try:
+        await registry.close_all_audioutils()
+        logger.info("Audio utilities closed.")
+    except Exception as e:
+        logger.exception(f"Error closing audio utilities: {e}")
+
     # AsyncConfigManager currently has no shutdown watcher hook.
 
     logger.info("AMM shutdown complete.")
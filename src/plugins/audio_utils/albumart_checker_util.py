@@ -4,7 +4,6 @@ from __future__ import annotations
 from typing import ClassVar
 
 from sqlmodel import select
-from sqlalchemy.orm.strategy_options import selectinload
 
 from core.audioutil_base import AudioUtilBase, register_audioutil
 from core.dbmodels import DBFile, DBTrack, DBAlbum, DBAlbumTrack, DBPicture
@@ -24,24 +23,19 @@ class AlbumArtCheckerUtil(AudioUtilBase):
     exclusive: ClassVar[bool] = False
     heavy_io: ClassVar[bool] = False
 
-    async def get_files_with_album_art(self) -> list[DBFile]:
+    async def get_file_ids_with_album_art(self) -> list[int]:
         """
-        Returns all DBFile objects that belong to tracks
+        Returns the ids of all DBFiles that belong to tracks
         whose primary album contains DBPicture entries.
+        Only ids are selected: no ORM objects or eager-loaded tracks are built.
         """
-        async for session in DBInstance.get_session():
+        async with DBInstance.session_scope() as session:
             result = await session.exec(
-                select(DBFile)
+                select(DBFile.id)
                 .join(DBTrack, DBFile.track_id == DBTrack.id)
                 .join(DBAlbumTrack, DBAlbumTrack.track_id == DBTrack.id)
                 .join(DBAlbum, DBAlbumTrack.album_id == DBAlbum.id)
                 .join(DBPicture, DBAlbum.id == DBPicture.album_id)
-                .options(
-                    selectinload(DBFile.track),
-                    selectinload(DBFile.track).selectinload(DBTrack.album_tracks),
-                )
+                .distinct()
             )
-
-            rows = result.all()
-            await session.close()
-            return rows
+            return list(result.all())
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import subprocess
 from pathlib import Path
 from typing import Optional, ClassVar
 from asyncio import to_thread
@@ -16,8 +17,8 @@ logger = Logger()  # singleton
 @register_audioutil
 class ConverterUtil(AudioUtilBase):
     name: ClassVar[str] = "converter_util"
-    description: ClassVar[str] = "Converts audio files between codecs using pydub."
-    version: ClassVar[str] = "1.1.0"
+    description: ClassVar[str] = "Converts audio files between codecs using ffmpeg."
+    version: ClassVar[str] = "1.2.0"
     author: ClassVar[str] = "Mattijs Snepvangers"
     exclusive: ClassVar[bool] = False
     heavy_io: ClassVar[bool] = True  # conversion is I/O/CPU heavy; mark accordingly
@@ -61,9 +62,18 @@ class ConverterUtil(AudioUtilBase):
             self.logger.debug(f"Skipping {input_path}: already target format")
             return
 
+        # One ffmpeg process decodes and re-encodes frame by frame; nothing is materialised
+        # as PCM in Python (AudioSegment.from_file + export took two processes and the full
+        # decoded track in memory). -vn drops embedded cover art, as the pydub export did.
+        command = [
+            AudioSegment.converter, "-nostdin", "-v", "error", "-y",
+            "-i", str(input_path), "-vn", "-f", target_format, str(output_path),
+        ]
         try:
-            audio = AudioSegment.from_file(input_path, format=input_path.suffix[1:].lower())
-            audio.export(output_path, format=target_format)
+            result = subprocess.run(command, capture_output=True)
+            if result.returncode:
+                output_path.unlink(missing_ok=True)
+                raise RuntimeError(result.stderr.decode(errors="replace").strip())
             self.logger.info(f"Converted {input_path} -> {output_path}")
             input_path.unlink(missing_ok=True)
         except Exception as e:
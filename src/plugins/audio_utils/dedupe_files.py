@@ -1,13 +1,17 @@
 # audioutils/dedupe.py
 from __future__ import annotations
+from operator import itemgetter
 from typing import ClassVar, List, Dict, Any
 
 from core.audioutil_base import AudioUtilBase, register_audioutil
-from core.enums import CodecPriority
+from core.enums import Codec, CodecPriority
 from Singletons import Logger
 
 logger = Logger()  # singleton
 
+# Codec (a StrEnum, so plain "flac" strings match too) -> CodecPriority of the same name
+_CODEC_PRIORITY: dict[str, CodecPriority] = {codec: CodecPriority[codec.name] for codec in Codec}
+
 
 @register_audioutil
 class DedupeUtil(AudioUtilBase):
@@ -45,11 +49,11 @@ class DedupeUtil(AudioUtilBase):
             return {"keep": files[0], "delete": []}
 
         try:
-            sorted_files = sorted(
-                files,
-                key=lambda f: (CodecPriority[f.codec], f.bitrate),
-                reverse=True,
-            )
+            # keys are built once per file; the sort then only compares plain tuples
+            priority = _CODEC_PRIORITY.get
+            decorated = [((priority(f.codec, CodecPriority.UNKNOWN), f.bitrate), f) for f in files]
+            decorated.sort(key=itemgetter(0), reverse=True)
+            sorted_files = [f for _, f in decorated]
         except Exception as e:
             self.logger.error(f"Failed to dedupe files: {e}")
             raise
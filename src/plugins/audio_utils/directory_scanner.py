@@ -1,6 +1,9 @@
 # audioutils/directory_scanner.py
 from __future__ import annotations
 
+import asyncio
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
 from typing import List, Tuple, ClassVar
 
@@ -23,26 +26,54 @@ class DirectoryScanner(AudioUtilBase):
     author: ClassVar[str] = "Mattijs Snepvangers"
     exclusive: ClassVar[bool] = True
     heavy_io: ClassVar[bool] = False    # light I/O (metadata only)
+    max_scan_threads: ClassVar[int] = min(32, (os.cpu_count() or 1) * 4)
 
     def __init__(self) -> None:
         self.logger = Logger()
 
     async def scan(self, path: Path) -> Tuple[List[Path], List[Path]]:
         """Return (files, folders) recursively under a given directory."""
-        files: List[Path] = []
-        folders: List[Path] = []
-
         try:
-            for entry in path.iterdir():
-                if entry.is_dir():
-                    folders.append(entry)
-                    sub_files, sub_folders = await self.scan(entry)
-                    files.extend(sub_files)
-                    folders.extend(sub_folders)
-                elif entry.is_file():
-                    files.append(entry)
+            # the walk blocks on directory listings: keep it off the event loop
+            return await asyncio.to_thread(self._walk, path, self.max_scan_threads)
         except Exception as e:
             self.logger.error(f"Error scanning {path}: {e}")
             raise RuntimeError(f"Error scanning {path}: {e}") from e
 
-        return files, folders
\ No newline at end of file
+    @staticmethod
+    def _list_dir(directory: str) -> Tuple[List[str], List[str]]:
+        """(subdirectories, files) directly under one directory, via a single os.scandir."""
+        subdirs: List[str] = []
+        files: List[str] = []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                # the entry's cached d_type answers these without a stat() per entry
+                if entry.is_dir():
+                    subdirs.append(entry.path)
+                elif entry.is_file():
+                    files.append(entry.path)
+        return subdirs, files
+
+    @classmethod
+    def _walk(cls, path: Path, workers: int) -> Tuple[List[Path], List[Path]]:
+        """
+        Walk the tree with each directory listed on a pool thread. scandir releases the GIL,
+        so on slow or network filesystems the listings overlap instead of queueing.
+        """
+        files: List[Path] = []
+        folders: List[Path] = []
+
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dirscan")
+        try:
+            pending = {pool.submit(cls._list_dir, os.fspath(path))}
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    subdirs, dir_files = future.result()
+                    folders.extend(map(Path, subdirs))
+                    files.extend(map(Path, dir_files))
+                    pending.update(pool.submit(cls._list_dir, subdir) for subdir in subdirs)
+        finally:
+            pool.shutdown(cancel_futures=True)
+
+        return files, folders
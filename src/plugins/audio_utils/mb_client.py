@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Any, ClassVar, Optional
 
 import aiohttp
@@ -13,6 +14,8 @@ from config import Config
 
 logger = Logger()  # singleton instance
 
+ART_CACHE_SIZE = 4096
+
 
 @register_audioutil
 class MusicBrainzClient(AudioUtilBase):
@@ -48,65 +51,111 @@ class MusicBrainzClient(AudioUtilBase):
             "(pegasus.ict@gmail.com)"
         )
 
+        # pooled HTTP session shared by every request; bound to the loop that opened it
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        # mbid -> cover art URL (or None when the archive has none), oldest first;
+        # failed lookups raise in _request_cover and are never stored
+        self._art_cache: dict[str, Optional[str]] = {}
+
     # -------------------------
     # Internal request helpers
     # -------------------------
 
+    async def _http(self) -> aiohttp.ClientSession:
+        """The shared keep-alive session, (re)opened when missing, closed or from another loop."""
+        loop = asyncio.get_running_loop()
+        session = self._session
+        if session is not None and not session.closed and self._session_loop is loop:
+            return session
+
+        # a session left behind by another loop is closed before it is replaced
+        await self.close()
+        self._session = aiohttp.ClientSession(
+            headers={"User-Agent": self.user_agent},
+            connector=aiohttp.TCPConnector(limit_per_host=8, ttl_dns_cache=300),
+        )
+        self._session_loop = loop
+        return self._session
+
+    async def close(self) -> None:
+        """Close the shared HTTP session, on its own loop if that one is still running elsewhere."""
+        session, owner = self._session, self._session_loop
+        self._session = self._session_loop = None
+        if session is None or session.closed:
+            return
+
+        if owner is not None and owner.is_running() and owner is not asyncio.get_running_loop():
+            owner.call_soon_threadsafe(lambda: owner.create_task(session.close()))
+        else:
+            await session.close()
+
     async def _request(
         self,
         endpoint: str,
         params: Optional[dict[str, Any]] = None
     ) -> Optional[dict[str, Any]]:
-        headers = {"User-Agent": self.user_agent}
         url = f"{self.BASE_URL}/{endpoint}"
 
-        async with aiohttp.ClientSession(headers=headers) as session:
-            try:
-                async with session.get(url, params=params, timeout=20) as resp:
-                    if resp.status == 200:
-                        return await resp.json()
+        session = await self._http()
+        try:
+            async with session.get(url, params=params, timeout=20) as resp:
+                if resp.status == 200:
+                    return await resp.json()
 
-                    self.logger.warning(
-                        f"MusicBrainz request failed ({resp.status}): {url}"
-                    )
+                self.logger.warning(
+                    f"MusicBrainz request failed ({resp.status}): {url}"
+                )
 
-            except ClientError as e:
-                self.logger.error(f"Network error while requesting {url}: {e}")
-                raise OperationFailedError(
-                    f"Network error while requesting {url}"
-                ) from e
+        except ClientError as e:
+            self.logger.error(f"Network error while requesting {url}: {e}")
+            raise OperationFailedError(
+                f"Network error while requesting {url}"
+            ) from e
 
-            except Exception as e:
-                self.logger.exception(
-                    f"Unexpected error during MusicBrainz request: {e}"
-                )
-                raise OperationFailedError(
-                    "Unexpected MusicBrainz request error."
-                ) from e
+        except Exception as e:
+            self.logger.exception(
+                f"Unexpected error during MusicBrainz request: {e}"
+            )
+            raise OperationFailedError(
+                "Unexpected MusicBrainz request error."
+            ) from e
 
         return None
 
     async def _request_cover(self, mbid: str) -> Optional[str]:
+        """
+        Cover art URL for mbid, or None when the archive definitely has none (404, or no
+        images). Anything else (rate limiting, server errors, timeouts) raises, so the
+        miss is not taken as final.
+        """
         url = f"{self.COVERART_URL}/{mbid}"
-        headers = {"User-Agent": self.user_agent}
-
-        async with aiohttp.ClientSession(headers=headers) as session:
-            try:
-                async with session.get(url, timeout=20) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        if data.get("images"):
-                            return data["images"][0]["thumbnails"].get("large")
-
-            except ClientError as e:
-                self.logger.error(
-                    f"Error retrieving cover art for {mbid}: {e}"
+
+        session = await self._http()
+        try:
+            async with session.get(url, timeout=20) as resp:
+                if resp.status == 200:
+                    images = (await resp.json()).get("images")
+                    if images:
+                        return images[0]["thumbnails"].get("large")
+                    return None
+                if resp.status == 404:
+                    return None
+
+                self.logger.warning(
+                    f"Cover art request failed ({resp.status}): {url}"
                 )
                 raise OperationFailedError(
-                    "Cover art retrieval failed."
-                ) from e
+                    f"Cover art retrieval failed ({resp.status})."
+                )
 
-        return None
+        except (ClientError, asyncio.TimeoutError) as e:
+            self.logger.error(
+                f"Error retrieving cover art for {mbid}: {e}"
+            )
+            raise OperationFailedError(
+                "Cover art retrieval failed."
+            ) from e
 
     # -------------------------
     # Lookup methods by ID
@@ -131,7 +180,16 @@ class MusicBrainzClient(AudioUtilBase):
         return await self.get_release_by_id(mbid)
 
     async def get_art(self, mbid: str) -> Optional[str]:
-        return await self._request_cover(mbid)
+        cache = self._art_cache
+        if mbid in cache:
+            # refresh recency: dicts keep insertion order, so re-insert at the end
+            url = cache[mbid] = cache.pop(mbid)
+            return url
+        url = await self._request_cover(mbid)
+        if len(cache) >= ART_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[mbid] = url
+        return url
 
     # -------------------------
     # Lookup by name
@@ -171,22 +229,21 @@ class MusicBrainzClient(AudioUtilBase):
             "fingerprint": fingerprint,
             "format": "json",
         }
-        headers = {"User-Agent": self.user_agent}
 
-        async with aiohttp.ClientSession(headers=headers) as session:
-            try:
-                async with session.get(url, params=params, timeout=20) as resp:
-                    if resp.status == 200:
-                        return await resp.json()
+        session = await self._http()
+        try:
+            async with session.get(url, params=params, timeout=20) as resp:
+                if resp.status == 200:
+                    return await resp.json()
 
-                    self.logger.warning(
-                        f"AcoustID lookup failed ({resp.status})"
-                    )
+                self.logger.warning(
+                    f"AcoustID lookup failed ({resp.status})"
+                )
 
-            except ClientError as e:
-                self.logger.error(f"Error during AcoustID lookup: {e}")
-                raise OperationFailedError(
-                    "AcoustID lookup failed."
-                ) from e
+        except ClientError as e:
+            self.logger.error(f"Error during AcoustID lookup: {e}")
+            raise OperationFailedError(
+                "AcoustID lookup failed."
+            ) from e
 
         return None
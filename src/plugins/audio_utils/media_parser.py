@@ -113,7 +113,7 @@ class MediaParser(AudioUtilBase):
             return self._safe_get(result)
 
         except Exception as e:
-            self.logger.debug(f"Could not get '{key}' from {file_path}: {e}")
+            self.logger.debug("Could not get '%s' from %s: %s", key, file_path, e)
             return None
 
     # --------------------------
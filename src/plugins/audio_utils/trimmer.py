@@ -2,6 +2,11 @@
 from __future__ import annotations
 
 import asyncio
+import math
+import subprocess
+import sys
+import tempfile
+from array import array
 from pathlib import Path
 from typing import ClassVar
 
@@ -15,6 +20,25 @@ from Singletons import Logger
 
 logger = Logger()  # singleton instance
 
+# Silence detection only needs the envelope: decode it as 16-bit mono at a reduced rate.
+ENVELOPE_RATE = 16000
+ENVELOPE_WIDTH = 2
+ENVELOPE_MAX_AMPLITUDE = 1 << (8 * ENVELOPE_WIDTH - 1)
+
+
+def _rms(chunk: bytes) -> int:
+    """
+    RMS of a chunk of s16le PCM. Replaces audioop.rms: audioop is gone from the stdlib
+    in 3.13, where pydub falls back to a pure-Python loop over every sample.
+    """
+    samples = array("h")
+    samples.frombytes(chunk[: len(chunk) - len(chunk) % ENVELOPE_WIDTH])
+    if not samples:
+        return 0
+    if sys.byteorder == "big":
+        samples.byteswap()
+    return int(math.sqrt(math.sumprod(samples, samples) / len(samples)))
+
 
 @register_audioutil
 class SilenceTrimmer(AudioUtilBase):
@@ -74,23 +98,14 @@ class SilenceTrimmer(AudioUtilBase):
         if not file.is_file():
             raise FileNotFoundError(f"File not found: {file}")
 
-        try:
-            sound = AudioSegment.from_file(file, format=str(codec))
-        except Exception as e:
-            raise OperationFailedError(f"Failed to load audio: {e}") from e
-
-        duration = len(sound)
+        envelope, duration = self._read_envelope(file, chunk_size)
         if duration == 0:
             raise OperationFailedError("Audio file is empty.")
 
-        start_trim = self._detect_silence_boundary(sound, duration, threshold, chunk_size)
-        end_trim = self._detect_silence_boundary(sound.reverse(), duration, threshold, chunk_size)
-
-        if end_trim <= start_trim:
+        start_trim, end_trim = self._compute_trim_points(envelope, duration, threshold, chunk_size)
+        if start_trim >= duration:
             raise OperationFailedError("Trimming would remove all audio data.")
 
-        trimmed = sound[start_trim : duration - end_trim]
-
         self.logger.info(
             f"Trimming {start_trim} ms at start and {end_trim} ms at end of {file}"
         )
@@ -99,6 +114,18 @@ class SilenceTrimmer(AudioUtilBase):
             self.logger.info("Dry run: export skipped.")
             return
 
+        if not start_trim and not end_trim:
+            self.logger.info(f"No silence to trim, export skipped: {file}")
+            return
+
+        # Only a file that actually changes is decoded in full and re-encoded.
+        try:
+            sound = AudioSegment.from_file(file, format=str(codec))
+        except Exception as e:
+            raise OperationFailedError(f"Failed to load audio: {e}") from e
+
+        trimmed = sound[start_trim : max(start_trim, len(sound) - end_trim)]
+
         try:
             trimmed.export(file, format=str(codec))
             self.logger.info(f"Trimmed file successfully exported: {file}")
@@ -109,21 +136,59 @@ class SilenceTrimmer(AudioUtilBase):
     # Silence detection
     # -----------------------------------------------------
 
-    def _detect_silence_boundary(
-        self,
-        sound: AudioSegment,
+    def _read_envelope(self, file: Path, chunk_size: int) -> tuple[list[int], int]:
+        """
+        RMS of every chunk_size ms of the file plus its duration in ms, streamed from an
+        ffmpeg pipe decoding to 16-bit mono at ENVELOPE_RATE; one chunk of PCM at a time.
+        """
+        command = [
+            AudioSegment.converter, "-nostdin", "-v", "error",
+            "-i", str(file),
+            "-ac", "1", "-ar", str(ENVELOPE_RATE), "-f", "s16le", "-",
+        ]
+        chunk_bytes = ENVELOPE_RATE * chunk_size // 1000 * ENVELOPE_WIDTH
+
+        envelope: list[int] = []
+        size = 0
+        # stderr goes to a file, not a pipe: nobody drains it while stdout is being read,
+        # so a chatty decoder would fill the pipe buffer and block both streams
+        with tempfile.TemporaryFile() as stderr:
+            try:
+                proc = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=stderr)
+            except OSError as e:
+                raise OperationFailedError(f"Failed to load audio: {e}") from e
+
+            with proc:
+                read = proc.stdout.read
+                while chunk := read(chunk_bytes):
+                    envelope.append(_rms(chunk))
+                    size += len(chunk)
+
+            stderr.seek(0)
+            errors = stderr.read()
+
+        if proc.returncode:
+            message = errors.decode(errors="replace").strip()
+            raise OperationFailedError(f"Failed to load audio: {message}")
+        return envelope, round(size / ENVELOPE_WIDTH * 1000 / ENVELOPE_RATE)
+
+    @staticmethod
+    def _compute_trim_points(
+        envelope: list[int],
         duration: int,
         threshold: int,
         chunk_size: int,
-    ) -> int:
-        trim_ms = 0
-
-        while trim_ms < duration:
-            segment = sound[trim_ms : trim_ms + chunk_size]
-
-            if len(segment) == 0 or segment.dBFS >= threshold:  # type: ignore
-                break
-
-            trim_ms += chunk_size
-
-        return trim_ms
+    ) -> tuple[int, int]:
+        """
+        Milliseconds of leading and trailing silence, in whole chunks. The dBFS threshold is
+        converted to an amplitude once, so each chunk costs a single integer comparison.
+        """
+        # dBFS >= threshold  <=>  rms >= max_amplitude * 10 ** (threshold / 20)
+        floor = ENVELOPE_MAX_AMPLITUDE * 10 ** (threshold / 20)
+
+        total = len(envelope)
+        first = next((i for i, rms in enumerate(envelope) if rms >= floor), total)
+        if first == total:
+            return duration, 0
+        last = next(i for i in range(total - 1, -1, -1) if envelope[i] >= floor)
+        return first * chunk_size, max(0, duration - (last + 1) * chunk_size)
@@ -59,7 +59,7 @@ class Exporter(ProcessorBase):
     async def run(self) -> None:
         self.export_dir.mkdir(parents=True, exist_ok=True)
 
-        async for session in self.db.get_session():
+        async with self.db.session_scope() as session:
             for track_id in self.batch:
 
                 # Fetch DBTrack and its files
@@ -84,7 +84,6 @@ class Exporter(ProcessorBase):
                 self.set_progress()
 
             await session.commit()
-            await session.close()
 
     # ------------------------------------------------------------------
     async def _export_one(self, input_path: Path) -> None:
@@ -74,7 +74,7 @@ class ScannerProcessor(ProcessorBase):
     # Main run loop
     # ---------------------------------------------------------
     async def run(self) -> None:
-        async for session in self.db.get_session():
+        async with self.db.session_scope() as session:
 
             # 1. Clean directories and detect new import files
             self._clean_empty_dirs()
@@ -93,8 +93,6 @@ class ScannerProcessor(ProcessorBase):
             if artwork:
                 self.emit_task(task_type=TaskType.ART_GETTER, batch=artwork)
 
-            await session.close()
-
         self.set_completed("Scanner cycle complete.")
 
 
@@ -128,11 +126,11 @@ class ScannerProcessor(ProcessorBase):
         # Registry-driven mapping
         tasks_by_stage = self.registry._stage_records  # { StageType: [task_name, ...] }
 
-        files = (await session.exec(select(DBFile))).all()
-        for file in files:
+        # Only the columns needed here: no full rows, no ORM objects in the identity map.
+        rows = (await session.exec(select(DBFile.id, DBFile.stage_type, DBFile.completed_tasks))).all()
+        for file_id, stage, completed_tasks in rows:
 
             # Use current stage; if NONE, start from the first available stage.
-            stage = file.stage_type
             if stage == StageType.NONE:
                 stage = self._next_stage(stage)
             if not stage:
@@ -143,9 +141,9 @@ class ScannerProcessor(ProcessorBase):
 
             # Determine which tasks still need to run
             for tname in task_names:
-                if tname not in file.completed_tasks:
+                if tname not in completed_tasks:
                     ttype = self.registry.get_task_class(tname).task_type
-                    stage_batches[ttype].append(file.id)
+                    stage_batches[ttype].append(file_id)
 
         return stage_batches
 
@@ -8,6 +8,9 @@ from config import Config
 from typing import Optional, Iterable
 
 
+COMMIT_EVERY = 500
+
+
 @register_task
 class AlbumArtChecker(TaskBase):
     """
@@ -43,15 +46,15 @@ class AlbumArtChecker(TaskBase):
     async def run(self) -> None:
         self.logger.info("Running AlbumArtChecker")
 
-        files = await self.util.get_files_with_album_art()
-        total = len(files)
-
-        async for session in self.db.get_session():
-            for i, file in enumerate(files):
-                await self.update_file_stage(file.id, session)
-                self.set_progress((i + 1) / total)
+        file_ids = await self.util.get_file_ids_with_album_art()
+        total = len(file_ids)
 
-            await session.commit()
-            await session.close()
+        async with self.db.session_scope() as session:
+            # one SELECT and one executemany UPDATE per COMMIT_EVERY files
+            for start in range(0, total, COMMIT_EVERY):
+                chunk = file_ids[start : start + COMMIT_EVERY]
+                await self.update_file_stages(chunk, session)
+                await session.commit()
+                self.set_progress(len(chunk))
 
         self.set_completed("Album art analysis completed")
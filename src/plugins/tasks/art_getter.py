@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 from pathlib import Path
-import urllib.request
+import asyncio
 import re
 from typing import ClassVar
 
-from core.exceptions import InvalidURLError
+import aiohttp
+
+from core.exceptions import InvalidURLError, OperationFailedError
 from Singletons import Logger, DBInstance
 from config import Config
 from core.enums import TaskType, ArtType, StageType
@@ -14,17 +16,25 @@ from core.types import DBInterface, MusicBrainzClientProtocol
 from core.task_base import register_task
 
 
+DOWNLOAD_TIMEOUT = aiohttp.ClientTimeout(total=60)
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+# ArtGetter logs its progress at INFO at most this many times per batch
+PROGRESS_LOG_LINES = 20
+
+
+_URL_RE = re.compile(
+    r"^https?://"                      # http:// or https://
+    r"(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|"  # domain
+    r"localhost|"
+    r"\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})"
+    r"(?::\d+)?"
+    r"(?:/?|[/?]\S+)$",
+    re.IGNORECASE,
+)
+
+
 def is_valid_url(url: str) -> bool:
-    regex = re.compile(
-        r"^https?://"                      # http:// or https://
-        r"(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|"  # domain
-        r"localhost|"
-        r"\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})"
-        r"(?::\d+)?"
-        r"(?:/?|[/?]\S+)$",
-        re.IGNORECASE,
-    )
-    return bool(url and regex.search(url))
+    return bool(url and _URL_RE.search(url))
 
 
 @register_task
@@ -47,6 +57,11 @@ class ArtGetter(TaskBase):
 
     depends = ["MusicBrainzClient"]
 
+    # CoverArtArchive lookups and image downloads in flight at once; the two stages are
+    # bounded separately so lookups keep running while earlier results download
+    max_parallel_lookups: ClassVar[int] = 8
+    max_parallel_fetches: ClassVar[int] = 4
+
     def __init__(
         self,
         MusicBrainzClient: MusicBrainzClientProtocol,
@@ -65,44 +80,116 @@ class ArtGetter(TaskBase):
         self.art_path = self.config.get_path("art")
 
         self._total = len(batch)
-        self._processed = 0
+        self._log_every = max(1, self._total // PROGRESS_LOG_LINES)
+        self._next_log_at = self._log_every
+        # downloaded pictures, registered in one batch at the end of run()
+        self._saved: list[tuple[str, ArtType, Path]] = []
+        # pooled HTTP session, open for the duration of run()
+        self._http: aiohttp.ClientSession | None = None
+        self._lookup_slots = asyncio.Semaphore(self.max_parallel_lookups)
+        self._download_slots = asyncio.Semaphore(self.max_parallel_fetches)
 
     # -----------------------------------------------
     async def run(self) -> None:
         self.logger.info("Running ArtGetter task")
-
-        for mbid, art_type in self.batch.items():
-            await self.get_art(mbid, art_type)
-            self.set_progress(self._processed / self._total)
+        # created once here, so the per-picture writes never hit a missing directory
+        await asyncio.to_thread(self.art_path.mkdir, parents=True, exist_ok=True)
+
+        async def fetch(mbid: str, art_type: ArtType) -> None:
+            try:
+                await self.get_art(mbid, art_type)
+            finally:
+                self._tick_progress()
+
+        # one keep-alive connection pool for every download in the batch
+        connector = aiohttp.TCPConnector(limit=self.max_parallel_fetches, ttl_dns_cache=300)
+        async with aiohttp.ClientSession(connector=connector, timeout=DOWNLOAD_TIMEOUT) as http:
+            self._http = http
+            try:
+                results = await asyncio.gather(
+                    *(fetch(mbid, art_type) for mbid, art_type in self.batch.items()),
+                    return_exceptions=True,
+                )
+            finally:
+                self._http = None
+
+        # one bad URL or download must not abort the rest of the batch
+        for mbid, result in zip(self.batch, results):
+            if isinstance(result, Exception):
+                self.logger.error("ArtGetter: failed to get art for %s: %s", mbid, result)
+
+        for mbid in await self.db.register_pictures(self._saved):
+            self.logger.warning("No owner found for MBID %s; art not registered", mbid)
 
         self.logger.info("ArtGetter task completed")
         self.set_completed("Art retrieval complete")
 
     # -----------------------------------------------
     async def get_art(self, mbid: str, art_type: ArtType) -> None:
-        self.logger.info(f"Retrieving {art_type.name} art for {mbid}")
+        save_path = self.art_path / f"{mbid}.jpg"
+        if await asyncio.to_thread(save_path.is_file):
+            # downloaded by an earlier run, which may not have got to registering it;
+            # register_pictures skips paths that are already in the pictures table
+            self._saved.append((mbid, art_type, save_path))
+            return
+
+        self.logger.debug("Retrieving %s art for %s", art_type.name, mbid)
 
-        url = await self.mbc.get_art(mbid)
+        async with self._lookup_slots:
+            url = await self.mbc.get_art(mbid)
         if not url:
-            self.logger.warning(f"No art found for MBID {mbid}")
-            self._processed += 1
+            self.logger.warning("No art found for MBID %s", mbid)
             return
 
-        await self.save_art(url, mbid, art_type)
-        self._processed += 1
+        async with self._download_slots:
+            await self.save_art(url, mbid, art_type)
+
+    def _tick_progress(self) -> None:
+        self.set_progress()
+        if self.processed >= self._next_log_at:
+            self._next_log_at += self._log_every
+            self.logger.info("ArtGetter: %d/%d done (%.0f%%)", self.processed, self._total, self.progress)
 
     # -----------------------------------------------
     async def save_art(self, url: str, mbid: str, art_type: ArtType) -> None:
         if not is_valid_url(url):
             raise InvalidURLError(f"Invalid URL: {url}")
 
-        save_path = Path(self.art_path) / f"{mbid}.jpg"
-
-        self.logger.info(f"Downloading {art_type.name.lower()} art: {url}")
-
-        # Heavy I/O — TaskManager handles thread offloading
-        urllib.request.urlretrieve(url, save_path)
-
-        await self.db.register_picture(mbid, art_type, save_path)
-
-        self.logger.info(f"Art saved to {save_path}")
+        save_path = self.art_path / f"{mbid}.jpg"
+
+        self.logger.debug("Downloading %s art: %s", art_type.name.lower(), url)
+
+        if self._http is None:
+            async with aiohttp.ClientSession(timeout=DOWNLOAD_TIMEOUT) as http:
+                await self._download(http, url, save_path)
+        else:
+            await self._download(self._http, url, save_path)
+
+        self._saved.append((mbid, art_type, save_path))
+
+        self.logger.debug("Art saved to %s", save_path)
+
+    @staticmethod
+    async def _download(http: aiohttp.ClientSession, url: str, save_path: Path) -> None:
+        """
+        Stream the response to save_path in DOWNLOAD_CHUNK_SIZE pieces. The body goes to a
+        .part file that is only renamed into place once complete, so an interrupted
+        download is never mistaken for existing art by get_art.
+        """
+        part = save_path.with_name(save_path.name + ".part")
+        async with http.get(url) as resp:
+            resp.raise_for_status()
+            if not resp.content_type.startswith("image/"):
+                raise OperationFailedError(f"Not an image ({resp.content_type}): {url}")
+
+            fh = await asyncio.to_thread(part.open, "wb")
+            try:
+                async for chunk in resp.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                    await asyncio.to_thread(fh.write, chunk)
+            except BaseException:
+                await asyncio.to_thread(fh.close)
+                part.unlink(missing_ok=True)
+                raise
+            await asyncio.to_thread(fh.close)
+
+        await asyncio.to_thread(part.replace, save_path)
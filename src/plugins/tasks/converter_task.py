@@ -1,4 +1,6 @@
 from __future__ import annotations
+import asyncio
+import os
 from pathlib import Path
 from typing import Any, Optional, Iterable, ClassVar
 
@@ -27,6 +29,7 @@ class ConverterTask(TaskBase):
     # MUST be explicit per new rules
     exclusive: ClassVar[bool] = False         # allows multiple conversions in parallel
     heavy_io: ClassVar[bool] = True           # file reading + writing
+    max_parallel_conversions: ClassVar[int] = os.cpu_count() or 2
 
     # Injected by registry
     depends = ["converter_util"]
@@ -64,6 +67,31 @@ class ConverterTask(TaskBase):
         from core.models import Track
         return await Track.from_id(track_id)
 
+    async def _convert_track(self, slots: asyncio.Semaphore, track_id: int) -> Optional[int]:
+        """Convert the first file of a track; returns its file id on success."""
+        try:
+            # the lookup holds a pooled DB connection, so it is throttled along with the work
+            async with slots:
+                track = await self._get_track(track_id)
+                if not getattr(track, "files", None):
+                    self.logger.warning(f"No files for track {track_id}.")
+                    return None
+
+                # first file only (your existing behaviour)
+                file = track.files[0]
+
+                # converter_util handles thread offloading internally or via TaskManager
+                await self.converter.convert_file(Path(file.file_path), file.codec)
+            return file.id
+
+        except Exception as e:
+            self.logger.error(f"Conversion failed for track {track_id}: {e}")
+            return None
+
+        finally:
+            self._processed += 1
+            self.set_progress()
+
     # ------------------------------------------------------------
     # Main async execution
     # ------------------------------------------------------------
@@ -74,33 +102,17 @@ class ConverterTask(TaskBase):
 
         self.logger.info(f"Starting ConverterTask for {self._total} tracks.")
 
-        async for session in self.db.get_session():
-            for track_id in self.batch:
-                try:
-                    track = await self._get_track(track_id)
-                    if not getattr(track, "files", None):
-                        self.logger.warning(f"No files for track {track_id}.")
-                        self._processed += 1
-                        self.set_progress(self._processed / self._total)
-                        continue
-
-                    # first file only (your existing behaviour)
-                    file = track.files[0]
-
-                    # converter_util handles thread offloading internally or via TaskManager
-                    await self.converter.convert_file(Path(file.file_path), file.codec)
-
-                    # update stage
-                    await self.update_file_stage(file.id, session)
-
-                    self._processed += 1
-                    self.set_progress(self._processed / self._total)
+        # Transcoding runs in ffmpeg processes (via worker threads), so several tracks
+        # convert at once; stage updates go through the one session afterwards.
+        slots = asyncio.Semaphore(self.max_parallel_conversions)
+        file_ids = await asyncio.gather(
+            *(self._convert_track(slots, track_id) for track_id in self.batch)
+        )
 
-                except Exception as e:
-                    self.logger.error(f"Conversion failed for track {track_id}: {e}")
+        async with self.db.session_scope() as session:
+            await self.update_file_stages([i for i in file_ids if i is not None], session)
 
             await session.commit()
-            await session.close()
 
         self.logger.info("Conversion task completed.")
         self.set_completed("All files converted successfully.")
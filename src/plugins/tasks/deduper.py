@@ -1,15 +1,22 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import ClassVar
+from sqlalchemy import delete
+from sqlalchemy.orm import selectinload
 from sqlmodel import select
 
 from core.task_base import TaskBase, register_task
 from core.types import DBInterface, DedupeFilesProtocol
 from core.enums import TaskType, StageType
 from Singletons import Logger, DBInstance
-from core.dbmodels import DBTrack
+from core.dbmodels import DBFile, DBTrack
 from config import Config
 
 
+UNLINK_WORKERS = 16
+
+
 @register_task
 class Deduper(TaskBase):
     """
@@ -55,16 +62,21 @@ class Deduper(TaskBase):
     async def run(self) -> None:
         self.logger.info(f"Starting Deduper for {self._total} tracks.")
 
-        async for session in self.db.get_session():
+        async with self.db.session_scope() as session:
 
-            for track_id in self.batch:
+            # all tracks and their files in two queries, not one query plus a lazy load per track
+            result = await session.exec(
+                select(DBTrack)
+                .where(DBTrack.id.in_(self.batch))  # type: ignore
+                .options(selectinload(DBTrack.files))  # type: ignore
+            )
+            tracks = {track.id: track for track in result.all()}
+
+            duplicates: list[DBFile] = []
+            keepers: list[int] = []
 
-                # Load track + files
-                result = await session.exec(
-                    select(DBTrack)
-                    .where(DBTrack.id == track_id)
-                )
-                track = result.one_or_none()
+            for track_id in self.batch:
+                track = tracks.get(track_id)
 
                 if not track:
                     self.logger.warning(f"Track {track_id} not found")
@@ -84,24 +96,48 @@ class Deduper(TaskBase):
                 keep = result["keep"]
                 to_delete = result["delete"]
 
-                # Delete lower-quality files
-                for file in to_delete:
-                    try:
-                        Path(file.file_path).unlink(missing_ok=True)
-                        await session.delete(file)
-                        self.logger.info(f"Removed duplicate file {file.id}")
-                    except Exception as e:
-                        self.logger.error(f"Error deleting file {file.file_path}: {e}")
+                # Lower-quality files are removed together after the loop
+                duplicates.extend(to_delete)
 
                 # Mark keeper
-                await self.update_file_stage(keep.id, session)
-
-                await session.commit()
+                keepers.append(keep.id)
 
                 self._processed += 1
                 self.set_progress(self._processed / self._total)
 
-            await session.close()
+            deleted = await asyncio.to_thread(self._unlink_files, duplicates)
+            if deleted:
+                await session.exec(delete(DBFile).where(DBFile.id.in_([f.id for f in deleted])))  # type: ignore
+            await self.update_file_stages(keepers, session)
+            await session.commit()
+
+            for file in deleted:
+                self.db.forget_file(file.file_path)
+                self.logger.info(f"Removed duplicate file {file.id}")
 
         self.logger.info("Deduplication completed successfully.")
         self.set_completed("Deduper finished.")
+
+    def _unlink_files(self, files: list[DBFile]) -> list[DBFile]:
+        """
+        Remove the files from disk on a small thread pool (unlink is a blocking metadata
+        operation); returns the ones that are gone, so only their rows get deleted.
+        """
+        if not files:
+            return []
+
+        def unlink(file: DBFile) -> Exception | None:
+            try:
+                Path(file.file_path).unlink(missing_ok=True)
+            except Exception as e:
+                return e
+            return None
+
+        deleted: list[DBFile] = []
+        with ThreadPoolExecutor(max_workers=min(UNLINK_WORKERS, len(files))) as pool:
+            for file, error in zip(files, pool.map(unlink, files)):
+                if error is None:
+                    deleted.append(file)
+                else:
+                    self.logger.error(f"Error deleting file {file.file_path}: {error}")
+        return deleted
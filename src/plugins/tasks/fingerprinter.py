@@ -78,14 +78,13 @@ class FingerPrinter(TaskBase):
     async def run(self) -> None:
         self.logger.info(f"FingerPrinter: processing {self._total} files")
 
-        async for session in self.db.get_session():
+        async with self.db.session_scope() as session:
             for file_id in self.batch: # type: ignore
                 await self._process_one(session, file_id)
                 self._processed += 1
                 self.set_progress(self._processed / self._total)
 
             await session.commit()
-            await session.close()
 
         self.set_completed("Fingerprinting completed.")
 
@@ -7,7 +7,7 @@ from typing import ClassVar, List
 
 from core.task_base import TaskBase, register_task
 from core.types import DBInterface, DirectoryScannerProtocol, StackProtocol
-from core.enums import StageType, TaskType
+from core.enums import StageType, Stat, TaskType
 from core.dbmodels import DBFile
 from config import Config
 from Singletons import DBInstance, Logger, Stack
@@ -88,14 +88,7 @@ class Importer(TaskBase):
         )
 
         # counters defined in legacy behaviour
-        for counter in (
-            "all_files",
-            "all_folders",
-            "removed_files",
-            "scanned_folders",
-            "scanned_files",
-            "imported_files",
-        ):
+        for counter in Stat:
             self.stack.add_counter(counter)
 
     # ------------------------------------------------------------
@@ -109,8 +102,8 @@ class Importer(TaskBase):
         files, folders = await self.scanner.scan(base)
 
         # statistics
-        self.stack.add_counter("scanned_folders", len(folders))
-        self.stack.add_counter("scanned_files", len(files))
+        self.stack.add_counter(Stat.SCANNED_FOLDERS, len(folders))
+        self.stack.add_counter(Stat.SCANNED_FILES, len(files))
 
         files_to_import: List[Path] = []
 
@@ -120,7 +113,7 @@ class Importer(TaskBase):
         for file_path in files:
             if self._should_import(file_path):
                 files_to_import.append(file_path)
-                self.stack.add_counter("all_files")
+                self.stack.add_counter(Stat.ALL_FILES)
             elif self._should_remove(file_path):
                 self._remove_file(file_path)
 
@@ -150,7 +143,7 @@ class Importer(TaskBase):
 
         try:
             file_path.unlink(missing_ok=True)
-            self.stack.add_counter("removed_files")
+            self.stack.add_counter(Stat.REMOVED_FILES)
         except Exception as e:
             self.logger.warning(f"Could not delete {file_path}: {e}")
 
@@ -159,7 +152,8 @@ class Importer(TaskBase):
         process_path = Path(self.config.get_path("process"))
         process_path.mkdir(parents=True, exist_ok=True)
 
-        async for session in self.db.get_session():
+        imported: List[str] = []
+        async with self.db.session_scope() as session:
             for original_path in files_to_import:
                 destination = self._unique_dest(process_path, original_path.name)
 
@@ -189,10 +183,15 @@ class Importer(TaskBase):
                     completed_tasks=[self.name],
                 )
                 session.add(db_file)
-                self.stack.add_counter("imported_files")
+                imported.append(db_file.file_path)
+                self.stack.add_counter(Stat.IMPORTED_FILES)
 
             await session.commit()
 
+        # these rows now exist: let file_exists() answer for them without a query
+        for file_path in imported:
+            self.db.remember_file(file_path)
+
         self.logger.info(
             f"Importer: {len(files_to_import)} files moved into {process_path}"
         )
@@ -56,7 +56,7 @@ class LyricsGetter(TaskBase):
 
     # ------------------------------------------------------------------
     async def run(self) -> None:
-        async for session in self.db.get_session():
+        async with self.db.session_scope() as session:
             try:
                 for track_id in self.batch:
                     await self._process_track(session, track_id)
@@ -68,9 +68,6 @@ class LyricsGetter(TaskBase):
                     f"LyricsGetter task encountered an error: {e}"
                 )
 
-            finally:
-                await session.close()
-
     async def _process_track(self, session: Any, track_id: int) -> None:
         track = await session.get(DBTrack, int(track_id))
         if track is None:
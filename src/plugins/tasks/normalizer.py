@@ -64,7 +64,7 @@ class Normalizer(TaskBase):
 
     # ------------------------------------------------------------------
     async def run(self) -> None:
-        async for session in self.db.get_session():
+        async with self.db.session_scope() as session:
             for file_id, path in self.batch.items():
 
                 try:
@@ -90,4 +90,3 @@ class Normalizer(TaskBase):
                 self.set_progress()
 
             await session.commit()
-            await session.close()
@@ -22,27 +22,23 @@ def set_fields(from_: dict | object, to: dict | object) -> dict | object:
     Copies all fields from `from_` to `to`. Supports both dicts and objects.
     Skips private attributes and callables.
     """
-
-    def is_valid(key: str, value: Any) -> bool:
-        return not key.startswith("_") and not callable(value)
-
-    # Determine source fields
+    # Determine source fields; the getattr default marks names dir() lists but cannot read
+    missing = object()
     if isinstance(from_, dict):
         source_items = from_.items()
     else:
-        source_items = (
-            (k, getattr(from_, k))
-            for k in dir(from_)
-            if hasattr(from_, k)
-        )
-
-    for key, value in source_items:
-        if not is_valid(key, value):
-            continue
-
-        if isinstance(to, dict):
-            to[key] = value
-        else:
+        source_items = ((k, getattr(from_, k, missing)) for k in dir(from_))
+
+    fields = {
+        key: value
+        for key, value in source_items
+        if value is not missing and not key.startswith("_") and not callable(value)
+    }
+
+    if isinstance(to, dict):
+        to.update(fields)
+    else:
+        for key, value in fields.items():
             setattr(to, key, value)
 
     return to
@@ -87,7 +83,7 @@ class Parser(TaskBase):
 
     # ------------------------------------------------------------------
     async def run(self) -> None:
-        async for session in self.db.get_session():
+        async with self.db.session_scope() as session:
             for file_id, file_path in self.batch.items():
 
                 try:
@@ -106,13 +102,12 @@ class Parser(TaskBase):
                     await self.update_file_stage(file_id, session)
 
                     session.add(db_file)
-                    self.logger.debug(f"Parsed file {file_path}")
+                    self.logger.debug("Parsed file %s", file_path)
 
                 except Exception as e:
-                    self.logger.error(f"Parser: Error processing {file_path}: {e}")
+                    self.logger.error("Parser: Error processing %s: %s", file_path, e)
                     continue
 
                 self.set_progress()
 
             await session.commit()
-            await session.close()
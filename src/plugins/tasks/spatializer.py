@@ -63,7 +63,7 @@ class SpatializerTask(TaskBase):
 
     # ------------------------------------------------------------------
     async def run(self) -> None:
-        async for session in self.db.get_session():
+        async with self.db.session_scope() as session:
             for file_id in self.batch: # type: ignore
                 await self._process_one(session, file_id)
 
@@ -72,7 +72,6 @@ class SpatializerTask(TaskBase):
                     self.set_progress(self._processed / self._total)
 
             await session.commit()
-            await session.close()
 
         self.logger.info("Spatializer task completed.")
 
@@ -51,12 +51,11 @@ class TaggerTask(TaskBase):
         self._processed = 0
 
     async def run(self) -> None:
-        async for session in self.db.get_session():
+        async with self.db.session_scope() as session:
             for track_id in self.batch:
                 await self._process_track(session, track_id)
 
             await session.commit()
-            await session.close()
 
         self.logger.info("Tagger task completed.")
 
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import asyncio
+import os
 from pathlib import Path
 from typing import ClassVar, Iterable, Optional
 
@@ -28,6 +30,7 @@ class TrimmerTask(TaskBase):
 
     exclusive: ClassVar[bool] = False
     heavy_io: ClassVar[bool] = True
+    max_parallel_trims: ClassVar[int] = os.cpu_count() or 2
 
     depends = ["silence_trimmer"]
 
@@ -49,37 +52,50 @@ class TrimmerTask(TaskBase):
         self._processed = 0
 
     async def run(self) -> None:
-        async for session in self.db.get_session():
-            for file_id in self.batch:
-                await self._process_file(session, file_id)
+        async with self.db.session_scope() as session:
+            targets = await self._load_targets(session)
 
-            await session.commit()
-            await session.close()
+            # Decoding and re-encoding happen in ffmpeg processes, so several files can be
+            # trimmed at once; the session is only touched again once they are all done.
+            slots = asyncio.Semaphore(self.max_parallel_trims)
+            results = await asyncio.gather(
+                *(self._trim(slots, file_path, codec) for _, file_path, codec in targets)
+            )
 
-        self.logger.info("Trimmer task completed.")
+            for (file_id, _, _), trimmed in zip(targets, results):
+                if trimmed:
+                    await self.update_file_stage(file_id, session)
 
-    async def _process_file(self, session: AsyncSessionLike, file_id: int) -> None:
-        dbfile = await self._load_file(session, file_id)
-        if dbfile is None:
-            self.logger.warning(f"Trimmer: file {file_id} not found")
-            return
+            await session.commit()
 
-        resolved = self._resolve_file_codec(dbfile, file_id)
-        if resolved is None:
-            return
-        file_path, codec = resolved
+        self.logger.info("Trimmer task completed.")
 
+    async def _load_targets(self, session: AsyncSessionLike) -> list[tuple[int, Path, Codec]]:
+        result = await session.exec(select(DBFile).where(DBFile.id.in_(self.batch)))  # type: ignore
+        files = {dbfile.id: dbfile for dbfile in result.all()}
+
+        targets: list[tuple[int, Path, Codec]] = []
+        for file_id in self.batch:
+            dbfile = files.get(file_id)
+            if dbfile is None:
+                self.logger.warning(f"Trimmer: file {file_id} not found")
+                continue
+            resolved = self._resolve_file_codec(dbfile, file_id)
+            if resolved is None:
+                continue
+            targets.append((file_id, *resolved))
+        return targets
+
+    async def _trim(self, slots: asyncio.Semaphore, file_path: Path, codec: Codec) -> bool:
         try:
-            await self.trimmer.trim(file_path, codec)
-            await self.update_file_stage(dbfile.id, session)
+            async with slots:
+                await self.trimmer.trim(file_path, codec)
+            return True
         except Exception as e:
             self.logger.error(f"Trimmer failed for {file_path}: {e}")
-
-        self._tick_progress()
-
-    async def _load_file(self, session: AsyncSessionLike, file_id: int) -> Optional[DBFile]:
-        result = await session.exec(select(DBFile).where(DBFile.id == file_id))
-        return result.one_or_none()
+            return False
+        finally:
+            self._tick_progress()
 
     def _resolve_file_codec(self, dbfile: DBFile, file_id: int) -> Optional[tuple[Path, Codec]]:
         if not dbfile.file_path:
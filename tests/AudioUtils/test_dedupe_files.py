@@ -0,0 +1,27 @@
+import asyncio
+from types import SimpleNamespace
+
+from core.enums import Codec
+from plugins.audio_utils.dedupe_files import DedupeUtil
+
+
+def _file(codec, bitrate):
+    return SimpleNamespace(codec=codec, bitrate=bitrate)
+
+
+def test_dedupe_keeps_best_codec_then_bitrate():
+    mp3_low, mp3_high, flac = _file(Codec.MP3, 128), _file(Codec.MP3, 320), _file(Codec.FLAC, 900)
+
+    result = asyncio.run(DedupeUtil().dedupe_files([mp3_low, flac, mp3_high]))
+
+    assert result["keep"] is flac
+    assert result["delete"] == [mp3_high, mp3_low]
+
+
+def test_dedupe_accepts_codec_strings():
+    ogg, wav = _file("ogg", 192), _file("wav", 1411)
+
+    result = asyncio.run(DedupeUtil().dedupe_files([ogg, wav]))
+
+    assert result["keep"] is wav
+    assert result["delete"] == [ogg]
@@ -0,0 +1,21 @@
+import asyncio
+
+import pytest
+
+from plugins.audio_utils.directory_scanner import DirectoryScanner
+
+
+def test_scan_lists_nested_files_and_folders(tmp_path):
+    (tmp_path / "artist" / "album").mkdir(parents=True)
+    (tmp_path / "loose.mp3").write_bytes(b"")
+    (tmp_path / "artist" / "album" / "01.flac").write_bytes(b"")
+
+    files, folders = asyncio.run(DirectoryScanner().scan(tmp_path))
+
+    assert sorted(files) == [tmp_path / "artist" / "album" / "01.flac", tmp_path / "loose.mp3"]
+    assert sorted(folders) == [tmp_path / "artist", tmp_path / "artist" / "album"]
+
+
+def test_scan_reports_missing_directory(tmp_path):
+    with pytest.raises(RuntimeError):
+        asyncio.run(DirectoryScanner().scan(tmp_path / "missing"))
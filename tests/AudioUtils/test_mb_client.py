@@ -19,6 +19,7 @@ import pytest
 
 pytest.importorskip("aiohttp")
 
+from core.exceptions import OperationFailedError
 from plugins.audio_utils.mb_client import MusicBrainzClient
 
 
@@ -40,3 +41,93 @@ def test_get_art_delegates_to_cover_request():
 
     assert result == "http://image"
     client._request_cover.assert_awaited_once_with("mbid123")
+
+
+def test_http_session_is_shared_until_closed():
+    client = MusicBrainzClient()
+
+    async def run():
+        first = await client._http()
+        assert await client._http() is first
+        await client.close()
+        assert first.closed
+        second = await client._http()
+        await client.close()
+        return first is not second
+
+    assert asyncio.run(run())
+
+
+def test_http_session_from_a_finished_loop_is_closed_when_replaced():
+    client = MusicBrainzClient()
+    first = asyncio.run(client._http())
+
+    async def run():
+        return await client._http()
+
+    second = asyncio.run(run())
+    try:
+        assert first.closed
+        assert second is not first
+    finally:
+        asyncio.run(client.close())
+
+
+def test_get_art_caches_per_mbid():
+    client = MusicBrainzClient()
+    client._request_cover = AsyncMock(side_effect=["http://image", None])
+
+    async def run():
+        return [await client.get_art(mbid) for mbid in ("a", "a", "b", "b")]
+
+    assert asyncio.run(run()) == ["http://image", "http://image", None, None]
+    assert client._request_cover.await_count == 2
+
+
+def test_get_art_does_not_cache_failed_lookups():
+    client = MusicBrainzClient()
+    client._request_cover = AsyncMock(side_effect=[OperationFailedError("503"), "http://image"])
+
+    async def run():
+        with pytest.raises(OperationFailedError):
+            await client.get_art("a")
+        return await client.get_art("a")
+
+    assert asyncio.run(run()) == "http://image"
+    assert client._request_cover.await_count == 2
+
+
+def test_request_cover_only_reports_definite_misses():
+    from aiohttp import web
+
+    responses = {
+        "missing": web.Response(status=404),
+        "empty": web.json_response({"images": []}),
+        "busy": web.Response(status=503),
+    }
+
+    async def run():
+        app = web.Application()
+        async def cover(request):
+            return responses[request.match_info["mbid"]]
+
+        app.router.add_get("/{mbid}", cover)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+
+        client = MusicBrainzClient()
+        client.COVERART_URL = f"http://127.0.0.1:{port}"
+        try:
+            missing = await client._request_cover("missing")
+            empty = await client._request_cover("empty")
+            with pytest.raises(OperationFailedError):
+                await client._request_cover("busy")
+            return missing, empty
+        finally:
+            await client.close()
+            await runner.cleanup()
+
+    assert asyncio.run(run()) == (None, None)
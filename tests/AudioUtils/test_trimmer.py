@@ -0,0 +1,87 @@
+import sys
+import threading
+
+import pytest
+
+from core.enums import Codec
+from core.exceptions import OperationFailedError
+from plugins.audio_utils.trimmer import SilenceTrimmer, _rms
+
+
+LOUD, QUIET = 10_000, 1
+
+
+def test_trim_points_cover_leading_and_trailing_silence():
+    envelope = [QUIET, QUIET, LOUD, QUIET, LOUD, QUIET, QUIET]
+
+    # last chunk is partial: 7 chunks of 10 ms, but only 65 ms of audio
+    assert SilenceTrimmer._compute_trim_points(envelope, 65, -50, 10) == (20, 15)
+
+
+def test_trim_points_all_silent():
+    assert SilenceTrimmer._compute_trim_points([QUIET] * 3, 30, -50, 10) == (30, 0)
+
+
+def test_rms_of_s16le_pcm():
+    pcm = b"".join(n.to_bytes(2, "little", signed=True) for n in (3, -4, 3, -4))
+
+    assert _rms(pcm) == 3  # sqrt(12.5), truncated like audioop.rms
+    assert _rms(pcm + b"\x01") == 3  # a trailing half sample is ignored
+    assert _rms(b"") == 0
+
+
+def test_untrimmed_file_is_not_decoded(tmp_path, monkeypatch):
+    file = tmp_path / "song.mp3"
+    file.write_bytes(b"")
+    trimmer = SilenceTrimmer()
+    monkeypatch.setattr(trimmer, "_read_envelope", lambda *_: ([LOUD, LOUD], 20))
+
+    def fail(*_args, **_kwargs):
+        raise AssertionError("full decode for a file without silence")
+
+    monkeypatch.setattr("plugins.audio_utils.trimmer.AudioSegment.from_file", fail)
+
+    trimmer._trim_sync(file, Codec.MP3, -50, 10, dry_run=False)
+
+
+def test_silent_file_is_rejected(tmp_path, monkeypatch):
+    file = tmp_path / "song.mp3"
+    file.write_bytes(b"")
+    trimmer = SilenceTrimmer()
+    monkeypatch.setattr(trimmer, "_read_envelope", lambda *_: ([QUIET], 10))
+
+    with pytest.raises(OperationFailedError):
+        trimmer._trim_sync(file, Codec.MP3, -50, 10, dry_run=False)
+
+
+FAKE_FFMPEG = """\
+import sys
+sys.stderr.write("x" * (1 << 20))  # far more than a pipe buffer holds
+sys.stdout.buffer.write(bytes(32000))  # 1 s of silent s16le at 16 kHz
+"""
+
+
+def _fake_ffmpeg(tmp_path, monkeypatch):
+    script = tmp_path / "ffmpeg.py"
+    script.write_text(FAKE_FFMPEG)
+    launcher = tmp_path / "ffmpeg"
+    launcher.write_text(f"#!/bin/sh\nexec {sys.executable} {script} \"$@\"\n")
+    launcher.chmod(0o755)
+    monkeypatch.setattr("plugins.audio_utils.trimmer.AudioSegment.converter", str(launcher))
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="shell launcher")
+def test_read_envelope_survives_a_flood_on_stderr(tmp_path, monkeypatch):
+    _fake_ffmpeg(tmp_path, monkeypatch)
+    result = []
+    reader = threading.Thread(
+        target=lambda: result.append(SilenceTrimmer()._read_envelope(tmp_path / "song.mp3", 10)),
+        daemon=True,
+    )
+    reader.start()
+    reader.join(timeout=30)
+
+    assert not reader.is_alive(), "ffmpeg blocked on a full stderr pipe"
+    envelope, duration = result[0]
+    assert duration == 1000
+    assert envelope == [0] * 100
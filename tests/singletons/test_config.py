@@ -1,3 +1,4 @@
+import asyncio
 import json
 import shutil
 import tempfile
@@ -10,6 +11,8 @@ from config import Config
 from config.models import AppConfig
 from config.defaults import DEFAULT_CONFIG, CONFIG_VERSION
 from config.manager import AsyncConfigManager
+from config.merger import merge_configs
+from core.exceptions import InvalidValueError
 
 
 @pytest.fixture(autouse=True)
@@ -25,7 +28,7 @@ def temp_config_file():
     temp_dir = tempfile.mkdtemp()
     config_path = Path(temp_dir) / "config.json"
     with Path.open(config_path, "w", encoding="utf-8") as f:
-        json.dump(DEFAULT_CONFIG, f, indent=4)
+        json.dump(merge_configs(DEFAULT_CONFIG, {}), f, indent=4)
     yield config_path
     shutil.rmtree(temp_dir)
 
@@ -57,9 +60,79 @@ def test_config_reload_sync(temp_config_file):
     config = Config.get_sync(config_file=temp_config_file)
 
     with Path.open(temp_config_file, "w", encoding="utf-8") as f:
-        new_config = dict(DEFAULT_CONFIG)
+        new_config = merge_configs(DEFAULT_CONFIG, {})
         new_config["version"] = "9.99"
         json.dump(new_config, f, indent=4)
 
     config.reload_sync()
     assert config.model.version != DEFAULT_CONFIG["version"]
+
+
+def test_merge_configs_does_not_alias_defaults():
+    """Mutating a merged config must not leak back into DEFAULT_CONFIG."""
+    merged = merge_configs(DEFAULT_CONFIG, {"paths": {"base": "/tmp/amm/"}})
+    merged["auth"]["admin_usernames"].append("someone")
+    merged["extensions"]["export"].append("ogg")
+
+    assert merged["paths"]["base"] == "/tmp/amm/"
+    assert merged["paths"]["art"] == DEFAULT_CONFIG["paths"]["art"]
+    assert DEFAULT_CONFIG["auth"]["admin_usernames"] == ()
+    assert "ogg" not in DEFAULT_CONFIG["extensions"]["export"]
+
+
+def test_update_revalidates_section_and_persists(temp_config_file):
+    """update() swaps in the changed section and writes it back to disk."""
+    config = Config.get_sync(config_file=temp_config_file)
+
+    asyncio.run(config.update("paths", "art", "covers/"))
+
+    assert config.model.paths.art == "covers/"
+    assert config.get_string("paths", "art") == "covers/"
+    on_disk = json.loads(temp_config_file.read_text(encoding="utf-8"))
+    assert on_disk["paths"]["art"] == "covers/"
+    assert on_disk["paths"]["import"] == DEFAULT_CONFIG["paths"]["import"]
+
+
+def test_get_path_tracks_updates(temp_config_file):
+    """get_path() resolves against base and picks up updated entries."""
+    config = Config.get_sync(config_file=temp_config_file)
+    base = Path(DEFAULT_CONFIG["paths"]["base"])
+
+    assert config.get_path("base") == base
+    assert config.get_path("import") == base / DEFAULT_CONFIG["paths"]["import"]
+
+    asyncio.run(config.update("paths", "art", "covers/"))
+    assert config.get_path("art") == base / "covers/"
+
+    with pytest.raises(InvalidValueError):
+        config.get_path("nope")
+
+
+def test_save_defaults_writes_aliased_json(tmp_path):
+    """save_defaults() serializes the model with its aliases."""
+    config_path = tmp_path / "config.json"
+    config = Config.get_sync(config_file=config_path)
+
+    asyncio.run(config.save_defaults())
+
+    on_disk = json.loads(config_path.read_text(encoding="utf-8"))
+    assert on_disk["paths"]["import"] == DEFAULT_CONFIG["paths"]["import"]
+    assert on_disk["extensions"]["import"] == list(DEFAULT_CONFIG["extensions"]["import"])
+
+
+def test_default_config_is_read_only():
+    """DEFAULT_CONFIG cannot be mutated in place."""
+    with pytest.raises(TypeError):
+        DEFAULT_CONFIG["paths"]["base"] = "/elsewhere/"
+
+
+def test_returned_containers_do_not_alias_the_cache(temp_config_file):
+    """Mutating a returned list or section leaves later reads untouched."""
+    config = Config.get_sync(config_file=temp_config_file)
+    expected = list(DEFAULT_CONFIG["extensions"]["export"])
+
+    config.get_list("extensions", "export").append("wav")
+    config.get_value("extensions", "export").append("ogg")
+    config.get("extensions.export").append("aac")
+
+    assert config.get_list("extensions", "export") == expected
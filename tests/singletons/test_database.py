@@ -0,0 +1,430 @@
+import asyncio
+import datetime as dt
+from pathlib import Path
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy import delete
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from Singletons.database import DB, _pool_options
+
+
+def memory_db() -> DB:
+    db = DB()
+    db.engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    db.async_session_factory = async_sessionmaker(bind=db.engine, class_=AsyncSession, expire_on_commit=False)
+    return db
+
+
+def make_file(file_path: str, **fields):
+    from dbmodels import DBFile
+
+    values = dict(
+        audio_ip="", processed=dt.datetime.now(dt.timezone.utc), bitrate=0, sample_rate=0,
+        channels=0, file_type="", file_size=0, file_name="", file_extension="", duration=0,
+        track_id=0, task_id=0, batch_id=0, file_path=file_path,
+    )
+    values.update(fields)
+    return DBFile(**values)
+
+
+def test_pool_options_skip_in_memory_sqlite():
+    assert _pool_options("sqlite+aiosqlite:///:memory:") == {}
+    options = _pool_options("sqlite+aiosqlite:///amm.db")
+    assert options["poolclass"] is AsyncAdaptedQueuePool
+    assert options["pool_size"] > 0
+
+
+def test_database_url_uses_async_mysql_driver():
+    from Singletons.env_config import _as_database_url
+
+    default = "sqlite+aiosqlite:///amm.db"
+    assert _as_database_url(None, default) == default
+    assert _as_database_url("mysql+pymysql://u:p@db/amm", default) == "mysql+asyncmy://u:p@db/amm"
+    assert _as_database_url("mariadb://u:p@db/amm", default) == "mariadb+asyncmy://u:p@db/amm"
+    assert _as_database_url("mysql+asyncmy://u:p@db/amm", default) == "mysql+asyncmy://u:p@db/amm"
+
+
+def test_session_scope_is_shared_by_nested_reads():
+    db = memory_db()
+
+    async def run():
+        async with db.session_scope() as outer:
+            async with db.session_scope() as inner:
+                assert inner is outer
+        async with db.session_scope() as fresh:
+            assert fresh is not outer
+        return await db.fetch_one(select(1))
+
+    assert asyncio.run(run()) == 1
+
+
+def test_snapshot_task_stats_copies_every_stat_row():
+    from dbmodels import DBTaskStat, DBTaskStatSnapshot
+    from core.enums import TaskType
+
+    db = memory_db()
+
+    async def run():
+        await db.init_db()
+        async with db.async_session_factory() as session:
+            session.add(DBTaskStat(task_type=TaskType.IMPORTER, imported=3))
+            session.add(DBTaskStat(task_type=TaskType.PARSER, parsed=2))
+            await session.commit()
+        await db.snapshot_task_stats()
+        return await db.fetch_all(select(DBTaskStatSnapshot))
+
+    snapshots = asyncio.run(run())
+    assert {snap.task_type: (snap.imported, snap.parsed) for snap in snapshots} == {
+        TaskType.IMPORTER: (3, 0),
+        TaskType.PARSER: (0, 2),
+    }
+    assert len({snap.snapshot_time for snap in snapshots}) == 1
+
+
+def test_set_file_stage_and_task_status_update_in_place():
+    from dbmodels import DBFile, DBTask
+    from core.enums import StageType, TaskStatus
+
+    db = memory_db()
+
+    async def run():
+        await db.init_db()
+        async with db.async_session_factory() as session:
+            session.add(make_file("/music/a.flac"))
+            session.add(DBTask(task_id="t-1", start_time=dt.datetime.now(dt.timezone.utc)))
+            await session.commit()
+        file = await db.fetch_one(select(DBFile))
+        assert await db.set_file_stage(file.id, StageType.IMPORT)
+        assert not await db.set_file_stage(file.id + 1, StageType.IMPORT)
+        assert await db.update_task_status("t-1", TaskStatus.PAUSED)
+        return await db.fetch_one(select(DBFile)), await db.get_paused_tasks()
+
+    file, paused = asyncio.run(run())
+    assert file.stage_type == StageType.IMPORT
+    assert [task.task_id for task in paused] == ["t-1"]
+
+
+def test_bulk_file_stage_updates():
+    from dbmodels import DBFile
+    from core.enums import StageType
+
+    db = memory_db()
+
+    async def run():
+        await db.init_db()
+        async with db.async_session_factory() as session:
+            session.add_all([make_file(f"/music/{n}.flac") for n in range(3)])
+            await session.commit()
+        ids = [file.id for file in await db.fetch_all(select(DBFile).order_by(DBFile.id))]
+        assert await db.set_file_stages_many(ids[:2], StageType.IMPORT) == 2
+        await db.set_file_stages({ids[1]: StageType.ANALYSE, ids[2]: StageType.PROCESS})
+        return [file.stage_type for file in await db.fetch_all(select(DBFile).order_by(DBFile.id))]
+
+    assert asyncio.run(run()) == [StageType.IMPORT, StageType.ANALYSE, StageType.PROCESS]
+
+
+def test_update_task_stats_applies_deltas():
+    from core.enums import TaskType
+
+    db = memory_db()
+
+    async def run():
+        await db.init_db()
+        await db.update_task_stats(TaskType.IMPORTER, imported=2, added_files=2, added_duration=300, added_size=4000)
+        await db.update_task_stats(TaskType.IMPORTER, imported=1, added_files=1, added_duration=0, added_size=2000)
+        return await db.get_task_stats(TaskType.IMPORTER)
+
+    stat = asyncio.run(run())
+    assert (stat.imported, stat.total_files, stat.total_playtime, stat.total_filesize) == (3, 3, 300, 6000)
+    assert (stat.average_playtime, stat.average_filesize) == (100, 2000)
+
+
+def test_file_exists_caches_hits_until_forgotten():
+    from dbmodels import DBFile
+
+    db = memory_db()
+
+    async def run():
+        await db.init_db()
+        assert not await db.file_exists("/music/a.flac")
+        async with db.async_session_factory() as session:
+            session.add(make_file("/music/a.flac"))
+            await session.commit()
+        assert await db.file_exists("/music/a.flac")
+        assert "/music/a.flac" in db._exists_cache
+
+        await db.execute_stmt(delete(DBFile))
+        cached = await db.file_exists("/music/a.flac")
+        db.forget_file("/music/a.flac")
+        return cached, await db.file_exists("/music/a.flac")
+
+    assert asyncio.run(run()) == (True, False)
+
+
+def test_register_picture_links_the_right_owner():
+    from dbmodels import DBLabel, DBPicture
+    from core.exceptions import InvalidValueError
+    from Enums import ArtType
+
+    db = memory_db()
+
+    async def run():
+        await db.init_db()
+        async with db.async_session_factory() as session:
+            session.add(DBLabel(name="Label", mbid="label-mbid", owner_id=0, parent_id=0, task_id=0))
+            await session.commit()
+        await db.register_picture("label-mbid", ArtType.LABEL, Path("/art/label.jpg"))
+        with pytest.raises(InvalidValueError):
+            await db.register_picture("missing", ArtType.ALBUM, Path("/art/album.jpg"))
+        return await db.fetch_all(select(DBPicture))
+
+    pictures = asyncio.run(run())
+    assert [(pic.picture_path, pic.label_id, pic.album_id) for pic in pictures] == [("/art/label.jpg", 1, None)]
+
+
+def test_rebuild_all_task_stats_aggregates_files_per_task_type():
+    from dbmodels import DBTask
+    from core.enums import TaskType
+
+    db = memory_db()
+
+    async def run():
+        await db.init_db()
+        now = dt.datetime.now(dt.timezone.utc)
+        async with db.async_session_factory() as session:
+            importer = DBTask(task_id="imp", start_time=now, task_type=TaskType.IMPORTER)
+            parser = DBTask(task_id="par", start_time=now, task_type=TaskType.PARSER)
+            session.add_all([importer, parser])
+            await session.flush()
+            session.add_all([
+                make_file("/music/a.flac", task_id=importer.id, duration=100, file_size=1000),
+                make_file("/music/b.flac", task_id=importer.id, duration=300, file_size=3000),
+                make_file("/music/c.flac", task_id=parser.id, duration=50, file_size=500),
+            ])
+            await session.commit()
+        await db.update_task_stats(TaskType.IMPORTER, imported=2)
+        await db.rebuild_all_task_stats()
+        return {
+            task_type: await db.get_task_stats(task_type)
+            for task_type in (TaskType.IMPORTER, TaskType.PARSER, TaskType.TRIMMER)
+        }
+
+    stats = asyncio.run(run())
+    importer = stats[TaskType.IMPORTER]
+    assert (importer.imported, importer.total_files, importer.total_playtime, importer.average_filesize) == (2, 2, 400, 2000)
+    assert (stats[TaskType.PARSER].total_files, stats[TaskType.PARSER].total_playtime) == (1, 50)
+    assert stats[TaskType.TRIMMER].total_files == 0
+
+
+def test_concurrent_update_task_stats_share_one_upsert():
+    from core.enums import TaskType
+
+    db = memory_db()
+    flushed = []
+    upsert = db._upsert_task_stats
+
+    async def counting_upsert(task_type, deltas):
+        flushed.append(task_type)
+        await upsert(task_type, deltas)
+
+    db._upsert_task_stats = counting_upsert
+
+    async def run():
+        await db.init_db()
+        await asyncio.gather(*(db.update_task_stats(TaskType.PARSER, parsed=1, added_files=1, added_size=10) for _ in range(5)))
+        return await db.get_task_stats(TaskType.PARSER)
+
+    stat = asyncio.run(run())
+    assert flushed == [TaskType.PARSER]
+    assert (stat.parsed, stat.total_files, stat.total_filesize, stat.average_filesize) == (5, 5, 50, 10)
+
+
+def test_update_task_stats_caller_during_running_upsert_starts_next_batch():
+    from core.enums import TaskType
+
+    db = memory_db()
+    flushed = []
+    release = None
+
+    async def gated_upsert(task_type, deltas):
+        flushed.append(deltas.imported)
+        if len(flushed) == 1:
+            await release.wait()
+
+    db._upsert_task_stats = gated_upsert
+
+    async def run():
+        nonlocal release
+        release = asyncio.Event()
+        first = asyncio.create_task(db.update_task_stats(TaskType.IMPORTER, imported=1))
+        while not flushed:
+            await asyncio.sleep(0)
+        # the first upsert is awaiting; these two open and join the next batch,
+        # and the first flush finishes while that batch is still open
+        late = [asyncio.create_task(db.update_task_stats(TaskType.IMPORTER, imported=n)) for n in (2, 3)]
+        release.set()
+        return await asyncio.gather(first, *late, return_exceptions=True)
+
+    assert asyncio.run(run()) == [None, None, None]
+    assert flushed == [1, 5]
+    assert not db._pending_stats and not db._stat_flushes
+
+
+def test_snapshot_streaming_and_latest():
+    from dbmodels import DBTaskStatSnapshot
+    from core.enums import TaskType
+
+    db = memory_db()
+    start = dt.datetime(2026, 1, 1, tzinfo=dt.timezone.utc)
+
+    async def run():
+        await db.init_db()
+        async with db.async_session_factory() as session:
+            session.add_all([
+                DBTaskStatSnapshot(task_type=TaskType.IMPORTER, snapshot_time=start + dt.timedelta(days=day), imported=day)
+                for day in range(5)
+            ])
+            await session.commit()
+        streamed = [snap.imported async for snap in db.iter_task_stat_snapshots(TaskType.IMPORTER, batch_size=2)]
+        latest = [snap.imported for snap in await db.get_latest_task_stat_snapshots(TaskType.IMPORTER)]
+        return streamed, latest
+
+    assert asyncio.run(run()) == ([0, 1, 2, 3, 4], [4, 3])
+
+
+def test_run_in_session_retries_once_on_dropped_connection(monkeypatch):
+    from sqlalchemy.exc import OperationalError
+
+    db = memory_db()
+    checkouts = []
+    connection = AsyncSession.connection
+
+    async def flaky_checkout(session, *args, **kwargs):
+        checkouts.append(session)
+        if len(checkouts) == 1:
+            raise OperationalError("SELECT 1", {}, Exception("gone away"), connection_invalidated=True)
+        return await connection(session, *args, **kwargs)
+
+    async def work(session):
+        calls.append(session)
+        return "ok"
+
+    calls = []
+    monkeypatch.setattr(AsyncSession, "connection", flaky_checkout)
+    assert asyncio.run(db.run_in_session(work)) == "ok"
+    # the checkout failed before work ran, so work ran exactly once, on the retry
+    assert len(checkouts) == 1
+    assert len(calls) == 1
+
+
+def test_run_in_session_does_not_replay_started_work():
+    from sqlalchemy.exc import OperationalError
+
+    db = memory_db()
+    calls = []
+
+    async def dropped_mid_write(session):
+        # e.g. the server applied the COMMIT and the ack was lost
+        calls.append(session)
+        raise OperationalError("COMMIT", {}, Exception("gone away"), connection_invalidated=True)
+
+    async def broken(session):
+        raise OperationalError("SELECT 1", {}, Exception("syntax"))
+
+    with pytest.raises(OperationalError):
+        asyncio.run(db.run_in_session(dropped_mid_write))
+    assert len(calls) == 1
+    with pytest.raises(OperationalError):
+        asyncio.run(db.run_in_session(broken))
+
+
+def test_session_scope_is_not_shared_with_spawned_tasks():
+    db = memory_db()
+
+    async def inner_session():
+        async with db.session_scope() as session:
+            return session
+
+    async def run():
+        async with db.session_scope() as outer:
+            spawned = await asyncio.create_task(inner_session())
+            return spawned is outer
+
+    assert asyncio.run(run()) is False
+
+
+def test_register_pictures_inserts_one_batch_and_reports_unknown_mbids():
+    from dbmodels import DBAlbum, DBLabel, DBPicture
+    from Enums import ArtType
+
+    db = memory_db()
+
+    async def run():
+        await db.init_db()
+        async with db.async_session_factory() as session:
+            session.add(DBLabel(name="Label", mbid="label-mbid", owner_id=0, parent_id=0, task_id=0))
+            session.add(DBAlbum(title="Album", mbid="album-mbid", task_id=0))
+            await session.commit()
+        missing = await db.register_pictures([
+            ("label-mbid", ArtType.LABEL, Path("/art/label.jpg")),
+            ("album-mbid", ArtType.ALBUM, Path("/art/album.jpg")),
+            ("missing", ArtType.ALBUM, Path("/art/missing.jpg")),
+        ])
+        pictures = await db.fetch_all(select(DBPicture).order_by(DBPicture.picture_path))
+        return missing, [(pic.picture_path, pic.album_id, pic.label_id) for pic in pictures]
+
+    missing, pictures = asyncio.run(run())
+    assert missing == ["missing"]
+    assert pictures == [("/art/album.jpg", 1, None), ("/art/label.jpg", None, 1)]
+
+
+def test_register_pictures_skips_paths_already_registered():
+    from dbmodels import DBAlbum, DBPicture
+    from Enums import ArtType
+
+    db = memory_db()
+
+    async def run():
+        await db.init_db()
+        async with db.async_session_factory() as session:
+            session.add(DBAlbum(title="Album", mbid="album-mbid", task_id=0))
+            session.add(DBAlbum(title="Other", mbid="other-mbid", task_id=0))
+            await session.commit()
+        await db.register_pictures([("album-mbid", ArtType.ALBUM, Path("/art/album.jpg"))])
+        missing = await db.register_pictures([
+            ("album-mbid", ArtType.ALBUM, Path("/art/album.jpg")),
+            ("other-mbid", ArtType.ALBUM, Path("/art/other.jpg")),
+        ])
+        pictures = await db.fetch_all(select(DBPicture).order_by(DBPicture.picture_path))
+        return missing, [(pic.picture_path, pic.album_id) for pic in pictures]
+
+    missing, pictures = asyncio.run(run())
+    assert missing == []
+    assert pictures == [("/art/album.jpg", 1), ("/art/other.jpg", 2)]
+
+
+def test_paused_tasks_carry_their_batch_after_the_session_closes():
+    from dbmodels import DBTask
+    from core.enums import TaskStatus, TaskType
+
+    db = memory_db()
+
+    async def run():
+        await db.init_db()
+        async with db.async_session_factory() as session:
+            task = DBTask(
+                task_id="p-1", start_time=dt.datetime.now(dt.timezone.utc),
+                task_type=TaskType.PARSER, status=TaskStatus.PAUSED,
+            )
+            session.add(task)
+            await session.flush()
+            session.add_all([make_file(f"/music/{n}.flac", task_id=task.id) for n in range(2)])
+            await session.commit()
+        return await db.get_paused_tasks()
+
+    (task,) = asyncio.run(run())
+    assert sorted(task.get_batch()) == [1, 2]
@@ -0,0 +1,18 @@
+from logging import FileHandler, StreamHandler
+
+from Singletons.logger import Logger
+
+
+def test_set_log_file_swaps_handlers_without_stacking(tmp_path):
+    logger = Logger()
+    original = logger.get_log_file()
+    try:
+        for name in ("first.log", "second.log"):
+            logger.set_log_file(str(tmp_path / name))
+        handlers = logger.get_logger().handlers
+        files = [h.baseFilename for h in handlers if isinstance(h, FileHandler)]
+        consoles = [h for h in handlers if type(h) is StreamHandler]
+        assert files == [str(tmp_path / "second.log")]
+        assert len(consoles) == 1
+    finally:
+        logger.set_log_file(original)
@@ -0,0 +1,32 @@
+import pytest
+
+from Singletons.stack import Stack, Stat
+
+
+@pytest.fixture(autouse=True)
+def reset_stack_singleton():
+    Stack._instance = None
+    yield
+    Stack._instance = None
+
+
+def test_known_counters_by_enum_and_name():
+    stack = Stack()
+    assert stack.add_counter(Stat.IMPORTED_FILES) == 1
+    assert stack.add_counter("imported_files", 2) == 3
+    assert stack.get_counter(Stat.IMPORTED_FILES) == 3
+
+
+def test_dynamic_counters_fall_back_to_dict():
+    stack = Stack()
+    stack.add_counter("custom", 5)
+    assert stack.get_counter("custom") == 5
+    assert stack.get_all()["custom"] == 5
+    assert stack.get_all()["all_files"] == 0
+
+
+def test_reset_all_clears_both_paths():
+    stack = Stack()
+    stack.add_counter(Stat.ALL_FILES, 4)
+    stack.add_counter("custom", 2)
+    assert set(stack.reset_all().values()) == {0}
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("dotenv")
+
+from Server.query import _page_total
+
+
+class _CountingSession:
+    def __init__(self, total: int) -> None:
+        self.total = total
+        self.counts = 0
+
+    async def exec(self, _stmt: object) -> SimpleNamespace:
+        self.counts += 1
+        return SimpleNamespace(one=lambda: self.total)
+
+
+@pytest.mark.parametrize(
+    ("offset", "page_len", "expected", "counts"),
+    [
+        (0, 3, 3, 0),  # short first page: the whole result set
+        (50, 7, 57, 0),  # short later page: ends the result set
+        (0, 0, 0, 0),  # empty table
+        (0, 25, 120, 1),  # full page: more rows may follow
+        (500, 0, 120, 1),  # offset past the end: count still needed
+    ],
+)
+def test_page_total_skips_count_when_the_page_ends_the_results(offset, page_len, expected, counts):
+    session = _CountingSession(total=120)
+    assert asyncio.run(_page_total(session, object(), offset, 25, page_len)) == expected
+    assert session.counts == counts